@@ -1,14 +1,15 @@
 import os
-import math
 import random
 import yaml
+import numpy as np
 import pygame
 
 # --- local modules ---
 import entities
-from entities import Blob, BerryBush, Tree, Flower, Mushroom, SugarCane, Rock
+from entities import Blob, BlobPool, BerryBushes, Tree, DecorationLayer
 import rendering
 import side_panel
+import world_cache
 
 
 # ------------------------------------------------------------
@@ -114,180 +115,247 @@ def main():
     blob_walk = pygame.transform.smoothscale(blob_walk, (TILE_SIZE, TILE_SIZE))
 
     BLOB_FRAMES = [blob_idle, blob_walk]
+    BLOB_FRAMES_YOUNG = [entities.tint(f, entities.YOUNG_TINT) for f in BLOB_FRAMES]
+    BLOB_FRAMES_OLD   = [entities.tint(f, entities.OLD_TINT) for f in BLOB_FRAMES]
 
     # Tree is 2 tiles tall
     tree_raw = pygame.image.load("tiles/tree.png").convert_alpha()
     TREE_IMAGE = pygame.transform.scale(tree_raw, (TILE_SIZE, TILE_SIZE * 2))
 
+    # RLE-encode the sprites loaded by hand (load_sprite does its own)
+    for img in BLOB_FRAMES + BLOB_FRAMES_YOUNG + BLOB_FRAMES_OLD + [TREE_IMAGE]:
+        img.set_alpha(255, pygame.RLEACCEL)
+
     # ---------- WORLD GENERATION ----------
-    # Height map + tile map
-    height_map = rendering.generate_height_map(
-        MAP_WIDTH,
-        MAP_HEIGHT,
-        cfg.get("noise", {})  # pass noise settings from config
-    )
-    height_map = rendering.standardise_map(height_map)
+    noise_cfg = cfg.get("noise", {})
+    rendering.apply_noise_config(noise_cfg)
 
-    tile_map = [
-        [
-            rendering.height_to_tile(height_map[y][x])
-            for x in range(MAP_WIDTH)
-        ]
-        for y in range(MAP_HEIGHT)
-    ]
-    
-    # ---------- CREATE GRASS MANAGER ----------
     grass_manager = rendering.GrassTileManager(TILE_SIZE)
     grass_manager.load_variants("tiles/grass", count=4)
-    noise_seed = cfg.get("noise", {}).get("seed", rendering.NOISE_SEED)
-    grass_manager.create_grass_map(tile_map, seed=noise_seed)
-    
-    # Create FERTILITY MAP: True for grass_1 tiles, False for others
-    fertility_map = []
-    for y in range(MAP_HEIGHT):
-        row = []
-        for x in range(MAP_WIDTH):
-            # Check if this is a grass_1 tile
-            if tile_map[y][x] == rendering.GRASS:
-                # Get the grass variant for this position
-                variant = grass_manager.grass_map[y][x] if hasattr(grass_manager, 'grass_map') else 0
-                # Only grass_1 (variant 0) is fertile
-                is_fertile = (variant == 0)
-            else:
-                is_fertile = False
-            row.append(is_fertile)
-        fertility_map.append(row)
-
-    flat_tiles = [t for row in tile_map for t in row]
 
-    tile_counts = {
-        "Deep water":   flat_tiles.count(rendering.DEEP_WATER),
-        "Water":        flat_tiles.count(rendering.WATER),
-        "Shallow water":flat_tiles.count(rendering.SHALLOW_WATER),
-        "Sand":         flat_tiles.count(rendering.SAND),
-        "Grass":        flat_tiles.count(rendering.GRASS),
-        "Forest":       flat_tiles.count(rendering.FOREST),
-    }
+    # Worlds generated from a fixed noise seed are saved to disk and reloaded
+    # on later launches instead of being regenerated. The file name includes
+    # a hash of the map size, noise and spawning settings, grass weights and
+    # simulation.random_seed (which decides the spawn positions).
+    cache_worlds = world_cfg.get("cache_worlds", True)
+    cache_dir = world_cfg.get("cache_dir", "worlds")
+    world_path = None
+    if cache_worlds and noise_cfg.get("seed") is not None:
+        world_key = world_cache.settings_key(
+            map_size=[MAP_WIDTH, MAP_HEIGHT],
+            noise=[
+                rendering.NOISE_SCALE, rendering.NOISE_OCTAVES,
+                rendering.NOISE_PERSISTENCE, rendering.NOISE_LACUNARITY,
+            ],
+            spawning=cfg.get("spawning", {}),
+            grass_weights=grass_manager.weights,
+            random_seed=sim_cfg.get("random_seed"),
+        )
+        world_path = world_cache.world_path(cache_dir, rendering.NOISE_SEED, world_key)
+    cached_world = (
+        world_cache.load_world(world_path, MAP_WIDTH, MAP_HEIGHT) if world_path else None
+    )
 
-    total_tiles = MAP_WIDTH * MAP_HEIGHT
+    # numeric state of every blob lives in one SoA pool
+    blob_pool = BlobPool()
+
+    if cached_world is not None:
+        tile_map = cached_world["tile_map"]
+        grass_manager.grass_map = cached_world["grass_map"]
 
-    # ---------- ENTITY SPAWNING ----------
-    bushes = []
-    trees = []
-    flowers = []
-    mushrooms = []
-    sugarcanes = []
-    rocks = []
-    blobs = []
-
-    flower_type_counts = [0, 0]  # index 0 -> flower_1, index 1 -> flower_2
-    occupied = set()             # tiles already occupied by ANY object
-
-    spawn_cfg = cfg.get("spawning", {})
-
-    bushes_grass_prob    = spawn_cfg.get("bushes", {}).get("grass_prob", 0.08)
-    bushes_forest_prob   = spawn_cfg.get("bushes", {}).get("forest_prob", 0.08)
-    flowers_grass_prob   = spawn_cfg.get("flowers", {}).get("grass_prob", 0.10)
-    sugar_cane_prob      = spawn_cfg.get("sugar_cane", {}).get("near_shallow_water_prob", 0.20)
-    rocks_grass_sand_prob= spawn_cfg.get("rocks", {}).get("grass_sand_prob", 0.05)
-    rocks_forest_prob    = spawn_cfg.get("rocks", {}).get("forest_prob", 0.10)
-    trees_forest_prob    = spawn_cfg.get("trees", {}).get("forest_prob", 0.60)
-    mushrooms_forest_prob= spawn_cfg.get("mushrooms", {}).get("forest_prob", 0.30)
-    blobs_grass_sand_prob= spawn_cfg.get("blobs", {}).get("grass_sand_prob", 0.01)
-    blobs_forest_prob    = spawn_cfg.get("blobs", {}).get("forest_prob", 0.01)
-
-    def is_next_to_shallow_water(x: int, y: int) -> bool:
-        """Check 4-directionally if this tile touches SHALLOW_WATER."""
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx = x + dx
-            ny = y + dy
-            if 0 <= nx < MAP_WIDTH and 0 <= ny < MAP_HEIGHT:
-                if tile_map[ny][nx] == rendering.SHALLOW_WATER:
-                    return True
-        return False
-
-    for y in range(MAP_HEIGHT):
-        for x in range(MAP_WIDTH):
-            tile = tile_map[y][x]
-            pos = (x, y)
+        trees = [Tree(x, y, TREE_IMAGE) for x, y in cached_world["trees"]]
+        blobs = [
+            Blob(blob_pool, x, y, BLOB_FRAMES, BLOB_FRAMES_YOUNG, BLOB_FRAMES_OLD)
+            for x, y in cached_world["blobs"]
+        ]
+
+        bush_spots      = cached_world["bushes"]
+        flower_spots    = cached_world["flowers"]
+        mushroom_spots  = cached_world["mushrooms"]
+        sugarcane_spots = cached_world["sugarcanes"]
+        rock_spots      = cached_world["rocks"]
+    else:
+        # Height map + tile map (for a fixed seed the height map is cached
+        # per noise config; random seeds would almost never be read back)
+        terrain_path = None
+        height_map = None
+        if world_path:
+            terrain_path = world_cache.terrain_path(
+                cache_dir, MAP_WIDTH, MAP_HEIGHT,
+                rendering.NOISE_SCALE, rendering.NOISE_OCTAVES,
+                rendering.NOISE_PERSISTENCE, rendering.NOISE_LACUNARITY,
+                rendering.NOISE_SEED,
+            )
+            height_map = world_cache.load_height_map(terrain_path, MAP_WIDTH, MAP_HEIGHT)
+
+        if height_map is None:
+            height_map = rendering.generate_height_map(
+                MAP_WIDTH,
+                MAP_HEIGHT,
+                noise_cfg  # pass noise settings from config
+            )
+            height_map = rendering.standardise_map(height_map)
+            if terrain_path:
+                world_cache.save_height_map(terrain_path, height_map)
+
+        tile_map = rendering.build_tile_map(height_map)
+    
+        # ---------- GRASS VARIANTS ----------
+        noise_seed = noise_cfg.get("seed", rendering.NOISE_SEED)
+        grass_manager.create_grass_map(tile_map, seed=noise_seed)
+    
+        # Create FERTILITY MAP: True for grass_1 tiles, False for others
+        # (non-grass tiles are -1 in the grass map, so only grass_1 is 0)
+        fertility_map = grass_manager.grass_map == 0
+
+        # ---------- ENTITY SPAWNING ----------
+        trees = []
+        blobs = []
+
+        # bushes and decorations are collected as (x, y[, kind]) and packed
+        # into BerryBushes / DecorationLayer columns once spawning is done
+        bush_spots = []
+        flower_spots = []
+        mushroom_spots = []
+        sugarcane_spots = []
+        rock_spots = []
+
+        # tiles already occupied by ANY object (one byte per tile, indexed [y, x])
+        occupied = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=np.bool_)
+
+        spawn_cfg = cfg.get("spawning", {})
+
+        bushes_grass_prob    = spawn_cfg.get("bushes", {}).get("grass_prob", 0.08)
+        bushes_forest_prob   = spawn_cfg.get("bushes", {}).get("forest_prob", 0.08)
+        flowers_grass_prob   = spawn_cfg.get("flowers", {}).get("grass_prob", 0.10)
+        sugar_cane_prob      = spawn_cfg.get("sugar_cane", {}).get("near_shallow_water_prob", 0.20)
+        rocks_grass_sand_prob= spawn_cfg.get("rocks", {}).get("grass_sand_prob", 0.05)
+        rocks_forest_prob    = spawn_cfg.get("rocks", {}).get("forest_prob", 0.10)
+        trees_forest_prob    = spawn_cfg.get("trees", {}).get("forest_prob", 0.60)
+        mushrooms_forest_prob= spawn_cfg.get("mushrooms", {}).get("forest_prob", 0.30)
+        blobs_grass_sand_prob= spawn_cfg.get("blobs", {}).get("grass_sand_prob", 0.01)
+        blobs_forest_prob    = spawn_cfg.get("blobs", {}).get("forest_prob", 0.01)
+
+        # tiles touching SHALLOW_WATER 4-directionally
+        next_to_shallow_water = rendering.shallow_water_adjacency(tile_map)
+
+        for y in range(MAP_HEIGHT):
+            for x in range(MAP_WIDTH):
+                tile = tile_map[y, x]
             
-            # Check if this tile is fertile (grass_1)
-            is_fertile_tile = fertility_map[y][x] if tile == rendering.GRASS else False
+                # Check if this tile is fertile (grass_1)
+                is_fertile_tile = fertility_map[y, x] if tile == rendering.GRASS else False
 
-            # ------ GRASS OR SAND TILE ------
-            if tile in (rendering.GRASS, rendering.SAND):
+                # ------ GRASS OR SAND TILE ------
+                if tile in (rendering.GRASS, rendering.SAND):
                 
-                # BUSHES (only on fertile grass_1 tiles)
-                if tile == rendering.GRASS:
-                    if (is_fertile_tile and  # ONLY SPAWN ON GRASS_1
-                        pos not in occupied and 
-                        random.random() < bushes_grass_prob):
-                        bushes.append(BerryBush(x, y))
-                        occupied.add(pos)
-
-                # FLOWERS (only on fertile grass_1 tiles)
-                if tile == rendering.GRASS:
-                    if (is_fertile_tile and  # ONLY SPAWN ON GRASS_1
-                        pos not in occupied and 
-                        random.random() < flowers_grass_prob):
-                        kind_index = random.randint(0, 1)
-                        img = FLOWER_IMAGES[kind_index]
-                        flowers.append(Flower(x, y, img, kind_index))
-                        flower_type_counts[kind_index] += 1
-                        occupied.add(pos)
-
-                # SUGAR CANE – only on fertile tiles next to SHALLOW_WATER
-                if (pos not in occupied and 
-                    is_next_to_shallow_water(x, y) and 
-                    random.random() < sugar_cane_prob):
+                    # BUSHES (only on fertile grass_1 tiles)
+                    if tile == rendering.GRASS:
+                        if (is_fertile_tile and  # ONLY SPAWN ON GRASS_1
+                            not occupied[y, x] and 
+                            random.random() < bushes_grass_prob):
+                            bush_spots.append((x, y))
+                            occupied[y, x] = True
+
+                    # FLOWERS (only on fertile grass_1 tiles)
+                    if tile == rendering.GRASS:
+                        if (is_fertile_tile and  # ONLY SPAWN ON GRASS_1
+                            not occupied[y, x] and 
+                            random.random() < flowers_grass_prob):
+                            kind_index = random.randint(0, 1)
+                            flower_spots.append((x, y, kind_index))
+                            occupied[y, x] = True
+
+                    # SUGAR CANE – only on fertile tiles next to SHALLOW_WATER
+                    if (not occupied[y, x] and 
+                        next_to_shallow_water[y, x] and 
+                        random.random() < sugar_cane_prob):
                     
-                    # Check if the tile is fertile (grass_1) OR sand
-                    # Sugar cane can spawn on sand OR grass_1
-                    if tile == rendering.SAND or is_fertile_tile:
-                        sugarcanes.append(SugarCane(x, y, SUGAR_CANE_IMAGE))
-                        occupied.add(pos)
-
-                # ROCKS – can spawn on grass_1 or sand
-                if pos not in occupied and random.random() < rocks_grass_sand_prob:
-                    # Rocks can spawn on sand OR grass_1
-                    if tile == rendering.SAND or is_fertile_tile:
-                        rocks.append(Rock(x, y, ROCK_IMAGE))
-                        occupied.add(pos)
+                        # Check if the tile is fertile (grass_1) OR sand
+                        # Sugar cane can spawn on sand OR grass_1
+                        if tile == rendering.SAND or is_fertile_tile:
+                            sugarcane_spots.append((x, y))
+                            occupied[y, x] = True
+
+                    # ROCKS – can spawn on grass_1 or sand
+                    if not occupied[y, x] and random.random() < rocks_grass_sand_prob:
+                        # Rocks can spawn on sand OR grass_1
+                        if tile == rendering.SAND or is_fertile_tile:
+                            rock_spots.append((x, y))
+                            occupied[y, x] = True
                 
-                # BLOBS - can spawn on grass_1 or sand
-                if pos not in occupied and random.random() < blobs_grass_sand_prob:
-                    # Blobs can spawn on sand OR grass_1
-                    if tile == rendering.SAND or is_fertile_tile:
-                        blobs.append(Blob(x, y, BLOB_FRAMES))
-                        occupied.add(pos)
-
-            # ------ FOREST TILE ------
-            elif tile == rendering.FOREST:
-                # Note: Forest doesn't use grass variants, so we don't check fertility_map
-                # TREES (forest only, no grass variant restriction)
-                if pos not in occupied and random.random() < trees_forest_prob:
-                    trees.append(Tree(x, y, TREE_IMAGE))
-                    occupied.add(pos)
-
-                # MUSHROOMS (forest only)
-                if pos not in occupied and random.random() < mushrooms_forest_prob:
-                    mushrooms.append(Mushroom(x, y, MUSHROOM_IMAGE))
-                    occupied.add(pos)
-
-                # ROCKS – can spawn in forest
-                if pos not in occupied and random.random() < rocks_forest_prob:
-                    rocks.append(Rock(x, y, ROCK_IMAGE))
-                    occupied.add(pos)
-
-                # BUSHES in forest (no grass variant restriction)
-                if pos not in occupied and random.random() < bushes_forest_prob:
-                    bushes.append(BerryBush(x, y))
-                    occupied.add(pos)
-
-                # BLOBS - can spawn in forest
-                if pos not in occupied and random.random() < blobs_forest_prob:
-                    blobs.append(Blob(x, y, BLOB_FRAMES))
-                    occupied.add(pos)
+                    # BLOBS - can spawn on grass_1 or sand
+                    if not occupied[y, x] and random.random() < blobs_grass_sand_prob:
+                        # Blobs can spawn on sand OR grass_1
+                        if tile == rendering.SAND or is_fertile_tile:
+                            blobs.append(Blob(blob_pool, x, y, BLOB_FRAMES, BLOB_FRAMES_YOUNG, BLOB_FRAMES_OLD))
+                            occupied[y, x] = True
+
+                # ------ FOREST TILE ------
+                elif tile == rendering.FOREST:
+                    # Note: Forest doesn't use grass variants, so we don't check fertility_map
+                    # TREES (forest only, no grass variant restriction)
+                    if not occupied[y, x] and random.random() < trees_forest_prob:
+                        trees.append(Tree(x, y, TREE_IMAGE))
+                        occupied[y, x] = True
+
+                    # MUSHROOMS (forest only)
+                    if not occupied[y, x] and random.random() < mushrooms_forest_prob:
+                        mushroom_spots.append((x, y))
+                        occupied[y, x] = True
+
+                    # ROCKS – can spawn in forest
+                    if not occupied[y, x] and random.random() < rocks_forest_prob:
+                        rock_spots.append((x, y))
+                        occupied[y, x] = True
+
+                    # BUSHES in forest (no grass variant restriction)
+                    if not occupied[y, x] and random.random() < bushes_forest_prob:
+                        bush_spots.append((x, y))
+                        occupied[y, x] = True
+
+                    # BLOBS - can spawn in forest
+                    if not occupied[y, x] and random.random() < blobs_forest_prob:
+                        blobs.append(Blob(blob_pool, x, y, BLOB_FRAMES, BLOB_FRAMES_YOUNG, BLOB_FRAMES_OLD))
+                        occupied[y, x] = True
+
+    # walkable tiles next to shallow water, for the blobs' water search
+    water_access = rendering.water_access_mask(tile_map)
+
+    bushes     = BerryBushes(bush_spots)
+    flowers    = DecorationLayer(flower_spots, FLOWER_IMAGES)
+    mushrooms  = DecorationLayer(mushroom_spots, [MUSHROOM_IMAGE])
+    sugarcanes = DecorationLayer(sugarcane_spots, [SUGAR_CANE_IMAGE])
+    rocks      = DecorationLayer(rock_spots, [ROCK_IMAGE])
+
+    # index 0 -> flower_1, index 1 -> flower_2
+    flower_type_counts = [flowers.count_kind(0), flowers.count_kind(1)]
+
+    if world_path and cached_world is None:
+        world_cache.save_world(
+            world_path,
+            tile_map=tile_map,
+            grass_map=grass_manager.grass_map,
+            bushes=bushes,
+            trees=trees,
+            flowers=flowers,
+            mushrooms=mushrooms,
+            sugarcanes=sugarcanes,
+            rocks=rocks,
+            blobs=blobs,
+        )
+
+    type_counts = np.bincount(tile_map.ravel(), minlength=8).tolist()
+    tile_counts = {
+        "Deep water":   type_counts[rendering.DEEP_WATER],
+        "Water":        type_counts[rendering.WATER],
+        "Shallow water":type_counts[rendering.SHALLOW_WATER],
+        "Sand":         type_counts[rendering.SAND],
+        "Grass":        type_counts[rendering.GRASS],
+        "Forest":       type_counts[rendering.FOREST],
+    }
+
+    total_tiles = MAP_WIDTH * MAP_HEIGHT
 
     # ---------- STATIC STATS (for side panel) ----------
     # Noise seed is stored in rendering.NOISE_SEED
@@ -308,6 +376,13 @@ def main():
         flower_type_counts=flower_type_counts,
         noise_seed=NOISE_SEED,
     )
+    static_panel, panel_layout = side_panel.render_static_panel(
+        font=FONT,
+        panel_width=PANEL_WIDTH,
+        window_height=WINDOW_HEIGHT,
+        stats_lines=stats_lines,
+        ui_cfg=ui_cfg,
+    )
 
     # ---------- SCROLLBAR STATE ----------
     dragging_h = False
@@ -392,19 +467,22 @@ def main():
 
         # ---------- UPDATE SIM ----------
         # bushes
-        for bush in bushes:
-            bush.update(dt)
+        bushes.update(dt)
+
+        # animation, aging + needs for the whole population
+        blob_pool.tick_animation(dt)
+        blob_pool.tick_needs(dt)
 
         # blobs + reproduction
         new_blobs = []
         for blob in blobs:
-            baby = blob.update(dt, tile_map, bushes, blobs)
+            baby = blob.update(dt, tile_map, bushes, water_access)
             if baby is not None:
                 new_blobs.append(baby)
 
-        # remove dead, add babies
-        blobs = [b for b in blobs if b.alive]
+        # add babies, remove dead
         blobs.extend(new_blobs)
+        blobs = blob_pool.compact(blobs)
 
         # ---------- RENDER ----------
         screen.fill((0, 0, 0))
@@ -456,8 +534,8 @@ def main():
             font=FONT,
             panel_x=panel_x,
             panel_width=PANEL_WIDTH,
-            window_height=WINDOW_HEIGHT,
-            stats_lines=stats_lines,
+            static_panel=static_panel,
+            layout=panel_layout,
             blobs=blobs,
             ui_cfg=ui_cfg,
         )
@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+import numpy as np
 
 # -------------------------------------------------
 # Debug flags (used in Blob.draw)
@@ -17,6 +18,7 @@ MAP_HEIGHT = 60
 TILE_SIZE = 32
 VIEW_TILES_X = 40
 VIEW_TILES_Y = 40
+HALF_TILE = TILE_SIZE / 2
 
 # -------------------------------------------------
 # Tile type IDs
@@ -35,38 +37,207 @@ ALL_TILES = [
     SAND, GRASS, FOREST
 ]
 
+# bit t is set if blobs can walk on tile type t
+WALKABLE_MASK = (1 << GRASS) | (1 << SAND) | (1 << FOREST)
+
+# -------------------------------------------------
+# Random headings: unit vectors for 2**HEADING_BITS evenly spaced angles,
+# picked with one getrandbits() call instead of uniform() + cos() + sin()
+# -------------------------------------------------
+HEADING_BITS = 10
+HEADINGS = [
+    (math.cos(a), math.sin(a))
+    for a in (2 * math.pi * k / (1 << HEADING_BITS) for k in range(1 << HEADING_BITS))
+]
+
+# -------------------------------------------------
+# Blob age tints (multiplied into the sprite)
+# -------------------------------------------------
+YOUNG_TINT = (100, 200, 255)
+OLD_TINT = (255, 120, 120)
+
+
+def tint(surface, color):
+    """Return a copy of `surface` with its pixels multiplied by `color`."""
+    tinted = surface.copy()
+    tinted.fill(color + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+    return tinted
+
+
+# Cell size (in tiles) of the spatial hashes used by the nearest-neighbour
+# searches; roughly the largest base sight a blob spawns with.
+GRID_CELL = 10
+# Finer cells for the adjacent-mate check, which only looks 1 tile away
+PAIR_CELL = 2
+
+
+def _visible_blits(xs, ys, kinds, images, cam_x, cam_y):
+    """
+    Build a Surface.blits() sequence for the tiles (xs, ys) that fall inside
+    the viewport; kinds[i] picks the image for entry i.
+    """
+    sx = xs - cam_x
+    sy = ys - cam_y
+    visible = (sx >= 0) & (sx < VIEW_TILES_X) & (sy >= 0) & (sy < VIEW_TILES_Y)
+
+    return [
+        (images[k], (px, py))
+        for k, px, py in zip(
+            kinds[visible].tolist(),
+            (sx[visible] * TILE_SIZE).tolist(),
+            (sy[visible] * TILE_SIZE).tolist(),
+        )
+    ]
+
+
+# squared distances from the centre of a (2r+1)^2 tile window, per r
+_WINDOW_DIST2 = {}
+
+
+def _window_dist2(r):
+    d2 = _WINDOW_DIST2.get(r)
+    if d2 is None:
+        off = np.arange(-r, r + 1)
+        d2 = (off[:, None] ** 2 + off[None, :] ** 2).astype(np.float64)
+        _WINDOW_DIST2[r] = d2
+    return d2
+
+
+# =================================================
+# SPATIAL HASH
+# =================================================
+
+class SpatialHash:
+    """
+    Uniform grid bucketing row indices by tile position.
+
+    Cells are keyed by (x // cell_size, y // cell_size), so a search within
+    `radius` tiles only visits the few cells overlapping that square.
+    """
+
+    def __init__(self, cell_size=GRID_CELL):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+    def rebuild(self, xs, ys):
+        """Re-bucket rows 0..N-1 at tile positions (xs[i], ys[i])."""
+        c = self.cell_size
+        cells = {}
+        for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            cells.setdefault((x // c, y // c), []).append(i)
+        self.cells = cells
+
+    def insert(self, i, x, y):
+        c = self.cell_size
+        self.cells.setdefault((x // c, y // c), []).append(i)
+
+    def remove(self, i, x, y):
+        c = self.cell_size
+        self.cells[(x // c, y // c)].remove(i)
+
+    def move(self, i, old_x, old_y, x, y):
+        """Re-bucket row `i` after it moved from (old_x, old_y) to (x, y)."""
+        c = self.cell_size
+        old_key = (old_x // c, old_y // c)
+        key = (x // c, y // c)
+        if old_key != key:
+            self.cells[old_key].remove(i)
+            self.cells.setdefault(key, []).append(i)
+
+    def query(self, x, y, radius):
+        """
+        Return the sorted row indices bucketed in cells overlapping the
+        square of `radius` tiles around (x, y).
+        """
+        c = self.cell_size
+        r = int(radius)
+        bx0, bx1 = (x - r) // c, (x + r) // c + 1
+        get = self.cells.get
+
+        found = []
+        extend = found.extend
+        for by in range((y - r) // c, (y + r) // c + 1):
+            for bx in range(bx0, bx1):
+                extend(get((bx, by), ()))
+        # sorted, so ties still resolve in row order
+        return np.sort(np.array(found, dtype=np.intp))
+
 
 # =================================================
 # BERRY BUSHES
 # =================================================
 
-class BerryBush:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.stage = 0
-        self.timer = 0.0
+class BerryBushes:
+    """
+    All berry bushes stored as parallel NumPy columns (x, y, timer, stage).
+
+    Growth for every bush is advanced with a few vectorized operations per
+    frame. Blobs refer to a bush by its index into these columns.
+    """
+
+    RIPE = 2  # stage a bush can be harvested at
+
+    def __init__(self, positions):
+        """`positions` holds (x, y) tuples."""
+        cols = (
+            np.array(positions, dtype=np.int32)
+            if len(positions) else np.zeros((0, 2), dtype=np.int32)
+        )
+        self.x = cols[:, 0].copy()
+        self.y = cols[:, 1].copy()
+        self.timer = np.zeros(len(cols))
+        self.stage = np.zeros(len(cols), dtype=np.int8)
+
+        # pixel centres, the point blobs walk to when harvesting
+        self.cx = self.x * TILE_SIZE + HALF_TILE
+        self.cy = self.y * TILE_SIZE + HALF_TILE
+
+        # only ripe bushes are bucketed: they enter when they ripen and
+        # leave when harvested, so searches never see unripe ones
+        self.ripe_grid = SpatialHash()
+
+        # blit list for the last camera position / stage layout
+        self._blits = []
+        self._blits_cam = None
+        self._dirty = True
+
+    def __len__(self):
+        return len(self.x)
+
+    def positions(self):
+        """Return an (N, 2) array of x, y."""
+        return np.stack([self.x, self.y], axis=1)
 
     def update(self, dt):
         self.timer += dt
 
-        if self.stage == 0 and self.timer > 5.0:
-            self.stage = 1
-        elif self.stage == 1 and self.timer > 10.0:
-            self.stage = 2
+        # both masks come from the old stages: one step per bush per frame
+        sprouting = (self.stage == 0) & (self.timer > 5.0)
+        ripening = (self.stage == 1) & (self.timer > 10.0)
+        if sprouting.any() or ripening.any():
+            self.stage[sprouting] = 1
+            self.stage[ripening] = 2
+            self._dirty = True
 
-    def harvest(self):
-        if self.stage == 2:
-            self.stage = 0
-            self.timer = 0.0
+            for i in np.flatnonzero(ripening).tolist():
+                self.ripe_grid.insert(i, self.x.item(i), self.y.item(i))
+
+    def harvest(self, i):
+        if self.stage[i] == self.RIPE:
+            self.stage[i] = 0
+            self.timer[i] = 0.0
+            self._dirty = True
+            self.ripe_grid.remove(i, self.x.item(i), self.y.item(i))
 
     def draw(self, screen, images, cam_x, cam_y):
-        sx = self.x - cam_x
-        sy = self.y - cam_y
-        if not (0 <= sx < VIEW_TILES_X and 0 <= sy < VIEW_TILES_Y):
-            return
-        img = images[self.stage]
-        screen.blit(img, (sx * TILE_SIZE, sy * TILE_SIZE))
+        if self._dirty or self._blits_cam != (cam_x, cam_y):
+            self._blits = _visible_blits(
+                self.x, self.y, self.stage, images, cam_x, cam_y
+            )
+            self._blits_cam = (cam_x, cam_y)
+            self._dirty = False
+
+        screen.blits(self._blits, doreturn=False)
 
 
 # =================================================
@@ -74,6 +245,8 @@ class BerryBush:
 # =================================================
 
 class Tree:
+    __slots__ = ("x", "y", "image", "rect")
+
     def __init__(self, x, y, image):
         self.x = x
         self.y = y
@@ -94,98 +267,324 @@ class Tree:
 
 
 # =================================================
-# FLOWERS
+# DECORATIONS (flowers, mushrooms, sugar cane, rocks)
 # =================================================
 
-class Flower:
-    def __init__(self, x, y, image, kind_index):
-        self.x = x
-        self.y = y
-        self.image = image
-        self.kind_index = kind_index  # 0 or 1
+class DecorationLayer:
+    """
+    Static one-tile decorations stored as parallel NumPy columns (x, y, kind)
+    instead of one object per tile. `kind` indexes into `images`, so a single
+    layer can hold several sprite variants (e.g. the two flower types).
+    """
 
-    def draw(self, screen, cam_x, cam_y):
-        sx = self.x - cam_x
-        sy = self.y - cam_y
-        if not (0 <= sx < VIEW_TILES_X and 0 <= sy < VIEW_TILES_Y):
-            return
-        screen.blit(self.image, (sx * TILE_SIZE, sy * TILE_SIZE))
+    def __init__(self, positions, images):
+        """`positions` holds (x, y) or (x, y, kind) tuples."""
+        cols = (
+            np.array(positions, dtype=np.int32)
+            if len(positions) else np.zeros((0, 2), dtype=np.int32)
+        )
+        self.x = cols[:, 0].copy()
+        self.y = cols[:, 1].copy()
+        if cols.shape[1] > 2:
+            self.kind = cols[:, 2].astype(np.uint8)
+        else:
+            self.kind = np.zeros(len(cols), dtype=np.uint8)
+        self.images = list(images)
 
+        # blit list for the last camera position (decorations never move)
+        self._blits = []
+        self._blits_cam = None
 
-# =================================================
-# MUSHROOMS
-# =================================================
+    def __len__(self):
+        return len(self.x)
 
-class Mushroom:
-    """Small decorative mushroom for forest tiles."""
+    def count_kind(self, kind):
+        return int(np.count_nonzero(self.kind == kind))
 
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
-        self.image = image
+    def positions(self):
+        """Return an (N, 3) array of x, y, kind."""
+        return np.stack([self.x, self.y, self.kind.astype(np.int32)], axis=1)
 
     def draw(self, screen, cam_x, cam_y):
-        sx = self.x - cam_x
-        sy = self.y - cam_y
-        if not (0 <= sx < VIEW_TILES_X and 0 <= sy < VIEW_TILES_Y):
-            return
-        screen.blit(self.image, (sx * TILE_SIZE, sy * TILE_SIZE))
+        if self._blits_cam != (cam_x, cam_y):
+            self._blits = _visible_blits(
+                self.x, self.y, self.kind, self.images, cam_x, cam_y
+            )
+            self._blits_cam = (cam_x, cam_y)
+
+        screen.blits(self._blits, doreturn=False)
 
 
 # =================================================
-# SUGAR CANE
+# BLOBS
 # =================================================
 
-class SugarCane:
-    """Sugar cane next to shallow water."""
+class BlobPool:
+    """
+    Numeric state of the whole blob population stored as parallel NumPy
+    columns (SoA). Row `i` belongs to the Blob whose `index` is `i`.
 
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
-        self.image = image
+    tick_animation() and tick_needs() advance the arm animation, aging,
+    needs, HP and the derived speed / strength / sight for every blob at
+    once; the per-blob AI in Blob.update only reads and writes single rows.
+    """
 
-    def draw(self, screen, cam_x, cam_y):
-        sx = self.x - cam_x
-        sy = self.y - cam_y
-        if not (0 <= sx < VIEW_TILES_X and 0 <= sy < VIEW_TILES_Y):
-            return
-        screen.blit(self.image, (sx * TILE_SIZE, sy * TILE_SIZE))
+    FLOAT_COLUMNS = (
+        "age", "hp", "hunger", "thirst", "repro_cooldown", "max_age",
+        "base_speed", "base_strength", "base_sight",
+        "speed", "strength", "sight", "anim_timer",
+    )
+    INT_COLUMNS = ("x", "y", "max_hp", "intelligence", "frame_index")
+    COLUMNS = FLOAT_COLUMNS + INT_COLUMNS + ("render_bucket", "alive")
+
+    # render_bucket values: which tinted frame list Blob.draw uses
+    YOUNG, ADULT, OLD = 0, 1, 2
+
+    HUNGER_RATE = 2.0   # how fast hunger increases
+    THIRST_RATE = 4.0   # how fast thirst increases
+
+    # stat multipliers per hunger / thirst / age band (see tick_needs)
+    HUNGER_SPEED    = np.array([1.1, 1.0, 1 / 1.5])
+    HUNGER_STRENGTH = np.array([2.0, 1.0, 1 / 2])
+    THIRST_SPEED    = np.array([1.1, 1.0, 1 / 1.5])
+    THIRST_STRENGTH = np.array([2.0, 1.0, 1 / 2])
+    AGE_SPEED       = np.array([1.0, 0.85, 0.6])
+    AGE_STRENGTH    = np.array([1.0, 0.9, 0.7])
+    AGE_SIGHT       = np.array([1.0, 0.8, 0.5])
+    LOW_HP_SIGHT    = np.array([1.0, 0.5])  # indexed by hp < 40
+
+    # inherited genes: parent average + jitter, clamped to [GENE_MIN, GENE_MAX];
+    # the first GENE_INTS genes use integer jitter in [-3, 3] and truncate
+    GENE_COLUMNS = ("intelligence", "base_strength", "base_speed", "base_sight", "max_age")
+    GENE_INTS    = 2
+    GENE_JITTER  = np.array([0.15, 0.3, 10.0])  # +/- range of the float genes
+    GENE_MIN     = np.array([1, 1, 0.1, 1.0, 30.0])
+    GENE_MAX     = np.array([100, 100, np.inf, np.inf, np.inf])
+
+    ANIM_SPEED = 0.5    # seconds per animation frame
+    ANIM_FRAMES = 2     # [idle, arms_up]
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        for name in self.FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        for name in self.INT_COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int32))
+        self.render_bucket = np.zeros(capacity, dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+
+        # rows bucketed by tile, coarse for sight-range searches and fine
+        # for the adjacent-mate check; move() keeps both in sync
+        self.grid = SpatialHash()
+        self.pair_grid = SpatialHash(PAIR_CELL)
+
+        # shared generator for gene jitter, seeded from `random` so a seeded
+        # run stays reproducible
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+    def add(self, **values):
+        """Append a row built from `values` (column -> value) and return its index."""
+        if self.size == len(self.alive):
+            for name in self.COLUMNS:
+                col = getattr(self, name)
+                grown = np.zeros(max(1, 2 * len(col)), dtype=col.dtype)
+                grown[:len(col)] = col
+                setattr(self, name, grown)
+
+        i = self.size
+        for name in self.COLUMNS:
+            getattr(self, name)[i] = values[name]
+        self.size += 1
+        self.grid.insert(i, values["x"], values["y"])
+        self.pair_grid.insert(i, values["x"], values["y"])
+        return i
+
+    def move(self, i, x, y):
+        """Move row `i` to tile (x, y), re-bucketing it in the grids."""
+        old_x = self.x.item(i)
+        old_y = self.y.item(i)
+        self.grid.move(i, old_x, old_y, x, y)
+        self.pair_grid.move(i, old_x, old_y, x, y)
+        self.x[i] = x
+        self.y[i] = y
+
+    def compact(self, blobs):
+        """
+        Drop the rows of dead blobs, renumber the survivors and return the
+        list of living blobs (in their original order).
+        """
+        n = self.size
+        keep = self.alive[:n].copy()
+        if keep.all():
+            return blobs
+
+        rows = np.flatnonzero(keep)
+        for name in self.COLUMNS:
+            col = getattr(self, name)
+            col[:len(rows)] = col[rows]
+        self.alive[len(rows):n] = False
+        self.size = len(rows)
+
+        self.grid.rebuild(self.x[:self.size], self.y[:self.size])
+        self.pair_grid.rebuild(self.x[:self.size], self.y[:self.size])
+
+        new_index = np.cumsum(keep) - 1
+        survivors = []
+        for blob in blobs:
+            if keep[blob.index]:
+                blob.index = int(new_index[blob.index])
+                survivors.append(blob)
+        return survivors
+
+    def tick_animation(self, dt):
+        """Advance every blob's animation clock, flipping frames when due."""
+        n = self.size
+        timer = self.anim_timer[:n]
+        frame = self.frame_index[:n]
+
+        timer += dt
+        flip = timer >= self.ANIM_SPEED
+        timer[flip] -= self.ANIM_SPEED
+        frame[flip] = (frame[flip] + 1) % self.ANIM_FRAMES
+
+    def tick_needs(self, dt):
+        """Advance aging, hunger / thirst, HP and stat factors for every blob."""
+        n = self.size
+        age = self.age[:n]
+        hp = self.hp[:n]
+        hunger = self.hunger[:n]
+        thirst = self.thirst[:n]
+        cooldown = self.repro_cooldown[:n]
 
+        # --- reproduction cooldown & aging ---
+        cooldown[cooldown > 0.0] -= dt
+        age += dt  # 1 age unit = 1 second of sim
 
-# =================================================
-# ROCKS
-# =================================================
+        # old age death
+        hp[age >= self.max_age[:n]] -= 1.0 * dt
 
-class Rock:
-    """Simple rock decoration/obstacle."""
+        self.render_bucket[:n] = np.where(
+            age <= 20, self.YOUNG, np.where(age >= 200, self.OLD, self.ADULT)
+        )
 
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
-        self.image = image
+        # --- needs / stats ---
+        hunger += self.HUNGER_RATE * dt
+        thirst += self.THIRST_RATE * dt
+        np.minimum(hunger, 100.0, out=hunger)
+        np.minimum(thirst, 100.0, out=thirst)
 
-    def draw(self, screen, cam_x, cam_y):
-        sx = self.x - cam_x
-        sy = self.y - cam_y
-        if not (0 <= sx < VIEW_TILES_X and 0 <= sy < VIEW_TILES_Y):
-            return
-        screen.blit(self.image, (sx * TILE_SIZE, sy * TILE_SIZE))
+        hp[hunger > 80] -= 2 * dt
+        hp[thirst > 85] -= 2 * dt
 
+        hp[hunger < 20] += 1 * dt
+        hp[thirst < 20] += 1 * dt
+
+        # --- penalties / buffs from hunger & thirst ---
+        # band 0 = low (< 30), 1 = normal, 2 = high (hunger > 80, thirst > 70)
+        hunger_band = (hunger >= 30).view(np.int8) + (hunger > 80)
+        thirst_band = (thirst >= 30).view(np.int8) + (thirst > 70)
+        speed_factor = self.HUNGER_SPEED[hunger_band] * self.THIRST_SPEED[thirst_band]
+        strength_factor = self.HUNGER_STRENGTH[hunger_band] * self.THIRST_STRENGTH[thirst_band]
+        sight_factor = self.LOW_HP_SIGHT[(hp < 40).view(np.int8)]
+
+        # --- age-based stat changes ---
+        # band 0 = up to 100, 1 = 100..200, 2 = 200 and over
+        age_band = (age > 100).view(np.int8) + (age >= 200)
+        speed_factor *= self.AGE_SPEED[age_band]
+        strength_factor *= self.AGE_STRENGTH[age_band]
+        sight_factor *= self.AGE_SIGHT[age_band]
+
+        hp[age_band == 2] -= 0.2 * dt  # extra old-age drain
+
+        np.multiply(self.base_speed[:n], speed_factor, out=self.speed[:n])
+        np.multiply(self.base_strength[:n], strength_factor, out=self.strength[:n])
+        np.multiply(self.base_sight[:n], sight_factor, out=self.sight[:n])
+
+        # clamp HP and check death
+        np.clip(hp, 0.0, self.max_hp[:n], out=hp)
+        self.alive[:n] &= hp > 0
+
+    def child_genes(self, i, j):
+        """
+        Return (intelligence, strength, speed, sight, max_age) for a child of
+        rows `i` and `j`, drawing all jitter in one batch.
+        """
+        parents = [i, j]
+        genes = np.array([getattr(self, name)[parents].sum() for name in self.GENE_COLUMNS]) / 2
+
+        k = self.GENE_INTS
+        genes[:k] = np.trunc(genes[:k] + self.rng.integers(-3, 4, size=k))
+        genes[k:] += self.rng.uniform(-1.0, 1.0, size=len(genes) - k) * self.GENE_JITTER
+        np.clip(genes, self.GENE_MIN, self.GENE_MAX, out=genes)
+
+        intelligence, strength, speed, sight, max_age = genes.tolist()
+        return int(intelligence), int(strength), speed, sight, max_age
+
+    def ready_to_mate(self, rows, adult_age, min_hp_fraction):
+        """
+        Bool mask over `rows` of adults off cooldown and in good enough
+        condition.
+        """
+        return (
+            self.alive[rows]
+            & (self.repro_cooldown[rows] <= 0.0)
+            & (self.age[rows] >= adult_age)
+            & (self.hp[rows] > min_hp_fraction * self.max_hp[rows])
+            & (self.hunger[rows] < 50.0)
+            & (self.thirst[rows] < 50.0)
+        )
+
+
+def _pool_column(name):
+    """Property exposing a blob's row of the BlobPool column `name`."""
+
+    def fget(self):
+        return getattr(self.pool, name).item(self.index)
+
+    def fset(self, value):
+        getattr(self.pool, name)[self.index] = value
+
+    return property(fget, fset)
 
-# =================================================
-# BLOBS
-# =================================================
 
 class Blob:
-    """A blob creature with simple 2-frame arm animation."""
+    """
+    A blob creature with simple 2-frame arm animation.
+
+    Stats live in a row of a shared BlobPool; the attributes created with
+    _pool_column read and write that row. AI / movement state stays here.
+    """
 
     EAT_RADIUS   = TILE_SIZE * 0.4   # how close to bush center to start harvesting
     DRINK_RADIUS = TILE_SIZE * 0.4   # how close to water-tile center to start drinking
+    # squared radii, compared against squared distances (no sqrt)
+    EAT_RADIUS_SQ   = EAT_RADIUS * EAT_RADIUS
+    DRINK_RADIUS_SQ = DRINK_RADIUS * DRINK_RADIUS
 
     ADULT_AGE    = 20.0
 
+    x              = _pool_column("x")
+    y              = _pool_column("y")
+    alive          = _pool_column("alive")
+    age            = _pool_column("age")
+    max_hp         = _pool_column("max_hp")
+    hp             = _pool_column("hp")
+    hunger         = _pool_column("hunger")
+    thirst         = _pool_column("thirst")
+    intelligence   = _pool_column("intelligence")
+    base_strength  = _pool_column("base_strength")
+    base_speed     = _pool_column("base_speed")
+    base_sight     = _pool_column("base_sight")
+    speed          = _pool_column("speed")
+    strength       = _pool_column("strength")
+    sight          = _pool_column("sight")
+    max_age        = _pool_column("max_age")
+    repro_cooldown = _pool_column("repro_cooldown")
+    anim_timer     = _pool_column("anim_timer")
+    frame_index    = _pool_column("frame_index")
+
     def __init__(
-        self, x, y, frames,
+        self, pool, x, y, frames, frames_young, frames_old,
         alive=True,
         age=0.0,
         max_hp=100,
@@ -198,46 +597,29 @@ class Blob:
         max_age=None,
         repro_cooldown=0.0
     ):
-        self.x = x
-        self.y = y
-
         # smooth position in pixels
         self.px = x * TILE_SIZE
         self.py = y * TILE_SIZE
 
-        self.frames = frames  # [idle, arms_up]
-        self.frame_index = 0
-        self.anim_timer = 0.0
-        self.anim_speed = 0.5  # seconds per frame
+        self.frames = frames  # [idle, arms_up], see BlobPool.ANIM_FRAMES
+        # the same frames pre-tinted with YOUNG_TINT / OLD_TINT
+        self.frames_young = frames_young
+        self.frames_old = frames_old
+        # indexed by BlobPool.render_bucket
+        self.frame_lists = (frames_young, frames, frames_old)
 
         # -- BLOB STATS -- #
-        self.alive = alive
-        self.age = age
-        self.max_hp = max_hp
-        self.hp = max_hp
-        self.hunger = hunger
-        self.thirst = thirst
-        self.intelligence = intelligence if intelligence is not None else random.randint(1, 100)
-        self.base_strength = strength if strength is not None else random.randint(1, 100)
-        self.base_speed = speed if speed is not None else random.uniform(0.5, 3)
-        self.base_sight = sight if sight is not None else random.uniform(4.0, 10.0)  # tiles
-
-        self.hunger_rate = 2.0   # how fast hunger increases
-        self.thirst_rate = 4.0   # how fast thirst increases
-
-        self.speed = self.base_speed
-        self.strength = self.base_strength
-        self.sight = self.base_sight
+        intelligence = intelligence if intelligence is not None else random.randint(1, 100)
+        strength = strength if strength is not None else random.randint(1, 100)
+        speed = speed if speed is not None else random.uniform(0.5, 3)
+        sight = sight if sight is not None else random.uniform(4.0, 10.0)  # tiles
 
         # -- MOVEMENT -- #
-        angle = random.uniform(0, 2 * math.pi)
-        self.dir_x = math.cos(angle)
-        self.dir_y = math.sin(angle)
-        self.change_dir_cooldown = random.uniform(0.5, 2.0)
+        self.pick_random_direction()
 
         # -- FOOD / WATER STATES -- #
         self.harvesting = False
-        self.harvest_target = None   # BerryBush
+        self.harvest_target = None   # index into BerryBushes
         self.harvest_timer = 0.0
 
         self.drinking = False
@@ -245,209 +627,168 @@ class Blob:
 
         self.food_target_tile = None   # (tx, ty) tile we want to reach for food
         self.water_target_tile = None  # (tx, ty) tile we want to reach for water
+        self.water_target_px = None    # pixel centre of water_target_tile
 
         # DEBUG
-        self.current_food_target = None   # BerryBush
+        self.current_food_target = None   # index into BerryBushes
         self.current_water_pos = None     # (wx, wy)
 
         # --- AGING / REPRODUCTION ---
-        self.max_age = max_age if max_age is not None else random.uniform(180.0, 260.0)
-        self.repro_cooldown = repro_cooldown
+        max_age = max_age if max_age is not None else random.uniform(180.0, 260.0)
+
+        self.pool = pool
+        self.index = pool.add(
+            x=x, y=y,
+            alive=alive,
+            age=age,
+            max_hp=max_hp,
+            hp=max_hp,
+            hunger=hunger,
+            thirst=thirst,
+            intelligence=intelligence,
+            base_strength=strength,
+            base_speed=speed,
+            base_sight=sight,
+            strength=strength,
+            speed=speed,
+            sight=sight,
+            max_age=max_age,
+            repro_cooldown=repro_cooldown,
+            anim_timer=0.0,
+            frame_index=0,
+            render_bucket=(
+                BlobPool.YOUNG if age <= 20
+                else BlobPool.OLD if age >= 200
+                else BlobPool.ADULT
+            ),
+        )
 
     # ---------- HELPERS ----------
 
-    def can_walk_on(self, tile_type):
-        return tile_type in (GRASS, SAND, FOREST)
-
     def pick_random_direction(self):
-        angle = random.uniform(0, 2 * math.pi)
-        self.dir_x = math.cos(angle)
-        self.dir_y = math.sin(angle)
-        self.change_dir_cooldown = random.uniform(0.5, 2.0)
-
-    def get_adjacent_shallow_water(self, tile_map, tx, ty):
-        """Return (wx, wy) of SHALLOW_WATER tile adjacent to (tx, ty), or None."""
-        height = len(tile_map)
-        width = len(tile_map[0]) if height > 0 else 0
-
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx = tx + dx
-            ny = ty + dy
-            if 0 <= nx < width and 0 <= ny < height:
-                if tile_map[ny][nx] == SHALLOW_WATER:
-                    return (nx, ny)
-        return None
+        self.dir_x, self.dir_y = HEADINGS[random.getrandbits(HEADING_BITS)]
+        self.change_dir_cooldown = 0.5 + 1.5 * random.random()  # uniform(0.5, 2.0)
 
     def find_nearest_ripe_bush(self, bushes):
-        """Find nearest ripe bush within sight radius (tiles)."""
-        best = None
-        best_dist2 = (self.sight ** 2)
-
-        for b in bushes:
-            if b.stage == 2:  # fully grown
-                dx = b.x - self.x
-                dy = b.y - self.y
-                dist2 = dx * dx + dy * dy
-                if dist2 <= best_dist2:
-                    best_dist2 = dist2
-                    best = b
-
-        return best
-
-    def find_nearest_water_tile(self, tile_map):
-        """
-        Find nearest WALKABLE tile that is next to SHALLOW_WATER
-        within sight radius. Returns (tx, ty) or None.
         """
-        height = len(tile_map)
-        width = len(tile_map[0]) if height > 0 else 0
-
-        best_tile = None
-        best_dist2 = (self.sight ** 2)
-
-        for ty in range(max(0, self.y - int(self.sight)),
-                        min(height, self.y + int(self.sight) + 1)):
-            for tx in range(max(0, self.x - int(self.sight)),
-                            min(width, self.x + int(self.sight) + 1)):
-                if not self.can_walk_on(tile_map[ty][tx]):
-                    continue
-                if self.get_adjacent_shallow_water(tile_map, tx, ty) is None:
-                    continue
-
-                dx = tx - self.x
-                dy = ty - self.y
-                dist2 = dx * dx + dy * dy
-                if dist2 <= best_dist2:
-                    best_dist2 = dist2
-                    best_tile = (tx, ty)
-
-        return best_tile
-
-    def find_nearest_mate(self, all_blobs):
+        Find nearest ripe bush within sight radius (tiles).
+        Returns its index into `bushes` (BerryBushes) or None.
         """
-        Find nearest suitable mate within sight.
-        Conditions:
-        - both are adults (age >= ADULT_AGE)
-        - both reproduction cooldown <= 0
-        - both healthy enough (hp > 60% max, hunger & thirst < 50)
-        """
-        if self.repro_cooldown > 0.0 or self.age < self.ADULT_AGE:
-            return None
+        x = self.x
+        y = self.y
+        sight = self.sight
 
-        if not (self.hp > 0.6 * self.max_hp and
-                self.hunger < 50.0 and
-                self.thirst  < 50.0):
+        ripe = bushes.ripe_grid.query(x, y, sight)
+        if len(ripe) == 0:
             return None
 
-        best = None
-        best_dist2 = (self.sight ** 2)
+        dx = bushes.x[ripe] - x
+        dy = bushes.y[ripe] - y
+        dist2 = dx * dx + dy * dy
 
-        for other in all_blobs:
-            if other is self or not other.alive:
-                continue
-
-            if other.repro_cooldown > 0.0 or other.age < self.ADULT_AGE:
-                continue
-
-            if not (other.hp > 0.6 * other.max_hp and
-                    other.hunger < 50.0 and
-                    other.thirst  < 50.0):
-                continue
-
-            dx = other.x - self.x
-            dy = other.y - self.y
-            dist2 = dx * dx + dy * dy
-            if dist2 <= best_dist2:
-                best_dist2 = dist2
-                best = other
-
-        return best
-
-    # ---------- UPDATE LOGIC ----------
-
-    def update(self, dt, tile_map, bushes, all_blobs):
-        offspring = None  # default
-
-        # --- animation ---
-        self.anim_timer += dt
-        if self.anim_timer >= self.anim_speed:
-            self.anim_timer -= self.anim_speed
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-
-        # --- reproduction cooldown & aging ---
-        if self.repro_cooldown > 0.0:
-            self.repro_cooldown -= dt
+        # last of equally near bushes, as the old linear scan (<=) picked
+        nearest = len(dist2) - 1 - int(np.argmin(dist2[::-1]))
+        if dist2[nearest] > sight * sight:
+            return None
+        return int(ripe[nearest])
 
-        self.age += dt  # 1 age unit = 1 second of sim
+    def find_nearest_water_tile(self, water_access):
+        """
+        Find nearest WALKABLE tile that is next to SHALLOW_WATER
+        within sight radius. `water_access` is the bool map of such tiles
+        (rendering.water_access_mask). Returns (tx, ty) or None.
+        """
+        height, width = water_access.shape
+        x = self.x
+        y = self.y
+        sight = self.sight
+        r = int(sight)
 
-        # old age death
-        if self.age >= self.max_age:
-            self.hp -= 1.0 * dt
+        x0, x1 = max(0, x - r), min(width, x + r + 1)
+        y0, y1 = max(0, y - r), min(height, y + r + 1)
 
-        # --- needs / stats ---
-        self.hunger = min(self.hunger + self.hunger_rate * dt, 100.0)
-        self.thirst = min(self.thirst + self.thirst_rate * dt, 100.0)
+        dist2 = _window_dist2(r)[y0 - y + r:y1 - y + r, x0 - x + r:x1 - x + r]
+        dist2 = np.where(water_access[y0:y1, x0:x1], dist2, np.inf).ravel()
 
-        if self.hunger > 80:
-            self.hp -= 2 * dt
-        if self.thirst > 85:
-            self.hp -= 2 * dt
+        # last of equally near tiles in row order, as the old scan (<=) picked
+        nearest = len(dist2) - 1 - int(np.argmin(dist2[::-1]))
+        if dist2[nearest] > sight * sight:
+            return None
 
-        if self.hunger < 20:
-            self.hp += 1 * dt
-        if self.thirst < 20:
-            self.hp += 1 * dt
+        wy, wx = divmod(nearest, x1 - x0)
+        return (x0 + wx, y0 + wy)
 
-        speed_factor = 1.0
-        strength_factor = 1.0
-        sight_factor = 1.0
+    def find_nearest_mate(self):
+        """
+        Find nearest suitable mate within sight.
+        Conditions:
+        - both are adults (age >= ADULT_AGE)
+        - both reproduction cooldown <= 0
+        - both healthy enough (hp > 60% max, hunger & thirst < 50)
+        Returns the mate's BlobPool index or None.
+        """
+        pool = self.pool
+        i = self.index
 
-        # --- penalties / buffs from hunger & thirst ---
-        if self.hunger > 80:
-            speed_factor *= 1 / 1.5
-            strength_factor *= 1 / 2
+        if not pool.ready_to_mate([i], self.ADULT_AGE, 0.6)[0]:
+            return None
 
-        if self.thirst > 70:
-            speed_factor *= 1 / 1.5
-            strength_factor *= 1 / 2
+        x = pool.x.item(i)
+        y = pool.y.item(i)
+        rows = pool.grid.query(x, y, pool.sight.item(i))
+        ready = pool.ready_to_mate(rows, self.ADULT_AGE, 0.6) & (rows != i)
 
-        if self.thirst < 30:
-            speed_factor *= 1.1
-            strength_factor *= 2.0
+        candidates = rows[ready]
+        if len(candidates) == 0:
+            return None
 
-        if self.hunger < 30:
-            speed_factor *= 1.1
-            strength_factor *= 2.0
+        dx = pool.x[candidates] - x
+        dy = pool.y[candidates] - y
+        dist2 = dx * dx + dy * dy
 
-        if self.hp < 40:
-            sight_factor *= 0.5
+        # last of equally near mates, as the old linear scan (<=) picked
+        nearest = len(dist2) - 1 - int(np.argmin(dist2[::-1]))
+        if dist2[nearest] > pool.sight.item(i) ** 2:
+            return None
+        return int(candidates[nearest])
 
-        # --- age-based stat changes ---
-        if 100 < self.age < 200:
-            speed_factor   *= 0.85
-            strength_factor *= 0.9
-            sight_factor   *= 0.8
+    def find_adjacent_mate(self):
+        """
+        Return the BlobPool index of the first blob in the 8-neighbourhood
+        that is ready to breed (hp > 70% max, hunger & thirst < 50), or None.
+        """
+        pool = self.pool
+        i = self.index
+        x = pool.x.item(i)
+        y = pool.y.item(i)
+
+        pool_x = pool.x
+        pool_y = pool.y
+        for j in pool.pair_grid.query(x, y, 1).tolist():
+            if j == i or abs(pool_x.item(j) - x) > 1 or abs(pool_y.item(j) - y) > 1:
+                continue
+            if pool.ready_to_mate([j], self.ADULT_AGE, 0.7)[0]:
+                return j
+        return None
 
-        if self.age >= 200:
-            speed_factor   *= 0.6
-            strength_factor *= 0.7
-            sight_factor   *= 0.5
-            self.hp -= 0.2 * dt  # extra old-age drain
+    # ---------- UPDATE LOGIC ----------
 
-        self.speed = self.base_speed * speed_factor
-        self.strength = self.base_strength * strength_factor
-        self.sight = self.base_sight * sight_factor
+    def update(self, dt, tile_map, bushes, water_access):
+        """
+        Run one tick of AI and movement. Animation, aging and needs were
+        already advanced for the whole population by BlobPool.tick_animation
+        and BlobPool.tick_needs. Returns a newborn Blob or None.
+        """
+        pool = self.pool
+        i = self.index
 
-        # clamp HP and check death
-        self.hp = max(0.0, min(self.hp, self.max_hp))
-        if self.hp <= 0:
-            self.alive = False
+        if not pool.alive[i]:
             return None
 
         # ---------- HARVESTING ----------
         if self.harvesting:
             if (self.harvest_target is None or
-                self.harvest_target.stage != 2):
+                bushes.stage[self.harvest_target] != BerryBushes.RIPE):
                 self.harvesting = False
                 self.harvest_target = None
                 self.harvest_timer = 0.0
@@ -456,9 +797,12 @@ class Blob:
             else:
                 self.harvest_timer += dt
                 if self.harvest_timer >= 1.0:
-                    self.harvest_target.harvest()
-                    self.hunger = max(0.0, self.hunger - 60.0)
-                    self.hp = min(self.max_hp, self.hp + 20.0)
+                    bushes.harvest(self.harvest_target)
+                    left = pool.hunger.item(i) - 60.0
+                    pool.hunger[i] = left if left > 0.0 else 0.0
+                    healed = pool.hp.item(i) + 20.0
+                    max_hp = pool.max_hp.item(i)
+                    pool.hp[i] = healed if healed < max_hp else max_hp
                     self.harvesting = False
                     self.harvest_target = None
                     self.harvest_timer = 0.0
@@ -474,19 +818,21 @@ class Blob:
                 self.drink_timer = 0.0
                 self.current_water_pos = None
             else:
-                tx, ty = self.water_target_tile
-                target_cx = tx * TILE_SIZE + TILE_SIZE / 2
-                target_cy = ty * TILE_SIZE + TILE_SIZE / 2
-                dist = math.hypot(self.px - target_cx, self.py - target_cy)
-                if dist > self.DRINK_RADIUS or self.thirst <= 0:
+                target_cx, target_cy = self.water_target_px
+                dx = self.px - target_cx
+                dy = self.py - target_cy
+                if dx * dx + dy * dy > self.DRINK_RADIUS_SQ or pool.thirst.item(i) <= 0:
                     self.drinking = False
                     self.drink_timer = 0.0
                     self.current_water_pos = None
                 else:
                     self.drink_timer += dt
                     if self.drink_timer >= 1.0:
-                        self.thirst = max(0.0, self.thirst - 70.0)
-                        self.hp = min(self.max_hp, self.hp + 10.0)
+                        left = pool.thirst.item(i) - 70.0
+                        pool.thirst[i] = left if left > 0.0 else 0.0
+                        healed = pool.hp.item(i) + 10.0
+                        max_hp = pool.max_hp.item(i)
+                        pool.hp[i] = healed if healed < max_hp else max_hp
                         self.drinking = False
                         self.drink_timer = 0.0
                         self.current_water_pos = None
@@ -495,21 +841,26 @@ class Blob:
             return None
 
         # ---------- DECISION: WATER VS FOOD VS MATE VS WANDER ----------
+        hunger = pool.hunger.item(i)
+        thirst = pool.thirst.item(i)
 
         # 1) FOOD
         food_target = None
-        if self.hunger > 40:
+        if hunger > 40:
             food_target = self.find_nearest_ripe_bush(bushes)
             self.current_food_target = food_target
-            self.food_target_tile = (food_target.x, food_target.y) if food_target else None
+            if food_target is not None:
+                self.food_target_tile = (int(bushes.x[food_target]), int(bushes.y[food_target]))
+            else:
+                self.food_target_tile = None
         else:
             self.current_food_target = None
             self.food_target_tile = None
 
         # 2) WATER
         water_target = None
-        if self.thirst > 40:
-            water_target = self.find_nearest_water_tile(tile_map)
+        if thirst > 40:
+            water_target = self.find_nearest_water_tile(water_access)
             self.water_target_tile = water_target
             self.current_water_pos = water_target
         else:
@@ -518,82 +869,75 @@ class Blob:
 
         # 3) MATE
         mate_target = None
-        if (self.hunger < 60 and self.thirst < 60 and
-            self.repro_cooldown <= 0.0 and self.age > 10.0):
-            mate_target = self.find_nearest_mate(all_blobs)
-
-        target_mode = "wander"
-        target_cx = target_cy = None
-
-        if self.thirst >= 70 and water_target is not None:
-            tx, ty = water_target
-            target_cx = tx * TILE_SIZE + TILE_SIZE / 2
-            target_cy = ty * TILE_SIZE + TILE_SIZE / 2
-            target_mode = "water"
+        if (hunger < 60 and thirst < 60 and
+            pool.repro_cooldown.item(i) <= 0.0 and pool.age.item(i) > 10.0):
+            mate_target = self.find_nearest_mate()
+
+        # pixel centre of the chosen target, highest priority first
+        if water_target is not None:
+            water_cx = water_target[0] * TILE_SIZE + HALF_TILE
+            water_cy = water_target[1] * TILE_SIZE + HALF_TILE
+            self.water_target_px = (water_cx, water_cy)
+
+        if thirst >= 70 and water_target is not None:
+            target_cx, target_cy, target_mode = water_cx, water_cy, "water"
         elif food_target is not None:
-            target_cx = food_target.x * TILE_SIZE + TILE_SIZE / 2
-            target_cy = food_target.y * TILE_SIZE + TILE_SIZE / 2
+            target_cx = bushes.cx.item(food_target)
+            target_cy = bushes.cy.item(food_target)
             target_mode = "food"
         elif mate_target is not None:
-            target_cx = mate_target.x * TILE_SIZE + TILE_SIZE / 2
-            target_cy = mate_target.y * TILE_SIZE + TILE_SIZE / 2
+            target_cx = pool.x.item(mate_target) * TILE_SIZE + HALF_TILE
+            target_cy = pool.y.item(mate_target) * TILE_SIZE + HALF_TILE
             target_mode = "mate"
         elif water_target is not None:
-            tx, ty = water_target
-            target_cx = tx * TILE_SIZE + TILE_SIZE / 2
-            target_cy = ty * TILE_SIZE + TILE_SIZE / 2
-            target_mode = "water"
+            target_cx, target_cy, target_mode = water_cx, water_cy, "water"
         else:
             target_mode = "wander"
 
         if target_mode in ("food", "water", "mate"):
             vx = target_cx - self.px
             vy = target_cy - self.py
-            length = math.hypot(vx, vy)
-            if length > 0:
-                self.dir_x = vx / length
-                self.dir_y = vy / length
+            length_sq = vx * vx + vy * vy
+            if length_sq > 0:
+                inv_len = 1.0 / math.sqrt(length_sq)
+                self.dir_x = vx * inv_len
+                self.dir_y = vy * inv_len
         else:
             self.change_dir_cooldown -= dt
             if self.change_dir_cooldown <= 0:
                 self.pick_random_direction()
 
         # ---------- MOVEMENT ----------
-        step = self.speed * dt * TILE_SIZE
+        step = pool.speed.item(i) * dt * TILE_SIZE
         new_px = self.px + self.dir_x * step
         new_py = self.py + self.dir_y * step
 
-        height = len(tile_map)
-        width = len(tile_map[0]) if height > 0 else 0
+        height, width = tile_map.shape
 
         tile_x = int(new_px // TILE_SIZE)
         tile_y = int(new_py // TILE_SIZE)
 
         if (0 <= tile_x < width and
             0 <= tile_y < height and
-            self.can_walk_on(tile_map[tile_y][tile_x])):
+            (WALKABLE_MASK >> tile_map.item(tile_y, tile_x)) & 1):
 
             self.px = new_px
             self.py = new_py
-            self.x = tile_x
-            self.y = tile_y
-
-            if target_mode == "food" and food_target is not None:
-                target_cx = food_target.x * TILE_SIZE + TILE_SIZE / 2
-                target_cy = food_target.y * TILE_SIZE + TILE_SIZE / 2
-                dist = math.hypot(self.px - target_cx, self.py - target_cy)
-                if dist <= self.EAT_RADIUS and food_target.stage == 2:
+            pool.move(i, tile_x, tile_y)
+
+            if target_mode == "food":
+                dx = self.px - target_cx
+                dy = self.py - target_cy
+                if dx * dx + dy * dy <= self.EAT_RADIUS_SQ and bushes.stage[food_target] == BerryBushes.RIPE:
                     self.harvesting = True
                     self.harvest_target = food_target
                     self.harvest_timer = 0.0
                     return None
 
-            if target_mode == "water" and self.water_target_tile is not None:
-                tx, ty = self.water_target_tile
-                target_cx = tx * TILE_SIZE + TILE_SIZE / 2
-                target_cy = ty * TILE_SIZE + TILE_SIZE / 2
-                dist = math.hypot(self.px - target_cx, self.py - target_cy)
-                if dist <= self.DRINK_RADIUS and self.thirst > 0:
+            if target_mode == "water":
+                dx = self.px - target_cx
+                dy = self.py - target_cy
+                if dx * dx + dy * dy <= self.DRINK_RADIUS_SQ and thirst > 0:
                     self.drinking = True
                     self.drink_timer = 0.0
                     return None
@@ -601,54 +945,41 @@ class Blob:
             self.pick_random_direction()
 
         # ---------- REPRODUCTION (pair-based) ----------
-        if self.repro_cooldown <= 0.0 and self.age >= self.ADULT_AGE:
-            if (self.hp > 0.7 * self.max_hp and
-                self.hunger < 50.0 and
-                self.thirst < 50.0):
-
-                mate = None
-                for other in all_blobs:
-                    if other is self or not other.alive:
-                        continue
-                    if other.repro_cooldown > 0.0 or other.age < self.ADULT_AGE:
-                        continue
-                    if not (other.hp > 0.7 * other.max_hp and
-                            other.hunger < 50.0 and
-                            other.thirst < 50.0):
-                        continue
-
-                    if abs(other.x - self.x) <= 1 and abs(other.y - self.y) <= 1:
-                        mate = other
-                        break
-
-                if mate is not None:
-                    if random.random() < 0.05 * dt:
-                        child_int   = max(1, min(100, int((self.intelligence + mate.intelligence) / 2 + random.randint(-3, 3))))
-                        child_str   = max(1, min(100, int((self.base_strength + mate.base_strength) / 2 + random.randint(-3, 3))))
-                        child_speed = max(0.1, (self.base_speed + mate.base_speed) / 2 + random.uniform(-0.15, 0.15))
-                        child_sight = max(1.0, (self.base_sight + mate.base_sight) / 2 + random.uniform(-0.3, 0.3))
-                        child_max_age = max(30.0, (self.max_age + mate.max_age) / 2 + random.uniform(-10.0, 10.0))
-
-                        offspring = Blob(
-                            self.x, self.y, self.frames,
-                            age=0.0,
-                            max_hp=self.max_hp,
-                            hunger=0.0,
-                            thirst=0.0,
-                            intelligence=child_int,
-                            strength=child_str,
-                            speed=child_speed,
-                            sight=child_sight,
-                            max_age=child_max_age,
-                            repro_cooldown=60.0
-                        )
-
-                        self.repro_cooldown = 45.0
-                        mate.repro_cooldown = 45.0
-
-                        return offspring
-
-        return offspring
+        if (pool.repro_cooldown.item(i) <= 0.0 and
+            pool.age.item(i) >= self.ADULT_AGE and
+            pool.hp.item(i) > 0.7 * pool.max_hp.item(i) and
+            hunger < 50.0 and
+            thirst < 50.0):
+
+            mate = self.find_adjacent_mate()
+
+            if mate is not None:
+                if random.random() < 0.05 * dt:
+                    child_int, child_str, child_speed, child_sight, child_max_age = (
+                        pool.child_genes(i, mate)
+                    )
+
+                    offspring = Blob(
+                        pool, pool.x.item(i), pool.y.item(i),
+                        self.frames, self.frames_young, self.frames_old,
+                        age=0.0,
+                        max_hp=pool.max_hp.item(i),
+                        hunger=0.0,
+                        thirst=0.0,
+                        intelligence=child_int,
+                        strength=child_str,
+                        speed=child_speed,
+                        sight=child_sight,
+                        max_age=child_max_age,
+                        repro_cooldown=60.0
+                    )
+
+                    pool.repro_cooldown[i] = 45.0
+                    pool.repro_cooldown[mate] = 45.0
+
+                    return offspring
+
+        return None
 
     def draw(self, screen, cam_x, cam_y):
         if not self.alive:
@@ -657,36 +988,27 @@ class Blob:
         sx = self.px - cam_x * TILE_SIZE
         sy = self.py - cam_y * TILE_SIZE
 
-        cx = int(sx + TILE_SIZE / 2)
-        cy = int(sy + TILE_SIZE / 2)
-
-        img = self.frames[self.frame_index]
-
-        frame_to_draw = img
-        if self.age <= 20:
-            tinted = img.copy()
-            tinted.fill((100, 200, 255, 255), special_flags=pygame.BLEND_RGBA_MULT)
-            frame_to_draw = tinted
-        elif self.age >= 200:
-            tinted = img.copy()
-            tinted.fill((255, 120, 120, 255), special_flags=pygame.BLEND_RGBA_MULT)
-            frame_to_draw = tinted
+        cx = int(sx + HALF_TILE)
+        cy = int(sy + HALF_TILE)
 
-        screen.blit(frame_to_draw, (sx, sy))
+        pool = self.pool
+        i = self.index
+        frames = self.frame_lists[pool.render_bucket.item(i)]
+        screen.blit(frames[pool.frame_index.item(i)], (sx, sy))
 
         if DEBUG_SIGHT:
             radius_px = int(self.sight * TILE_SIZE)
             pygame.draw.circle(screen, (255, 10, 10), (cx, cy), radius_px, 2)
 
-        if DEBUG_PATHS and self.current_food_target is not None:
-            fx = self.current_food_target.x * TILE_SIZE - cam_x * TILE_SIZE + TILE_SIZE / 2
-            fy = self.current_food_target.y * TILE_SIZE - cam_y * TILE_SIZE + TILE_SIZE / 2
+        if DEBUG_PATHS and self.food_target_tile is not None:
+            fx = self.food_target_tile[0] * TILE_SIZE - cam_x * TILE_SIZE + HALF_TILE
+            fy = self.food_target_tile[1] * TILE_SIZE - cam_y * TILE_SIZE + HALF_TILE
             pygame.draw.line(screen, (139, 69, 19), (cx, cy), (int(fx), int(fy)), 2)
 
         if DEBUG_PATHS and self.current_water_pos is not None:
             wx, wy = self.current_water_pos
-            wx_px = wx * TILE_SIZE - cam_x * TILE_SIZE + TILE_SIZE / 2
-            wy_px = wy * TILE_SIZE - cam_y * TILE_SIZE + TILE_SIZE / 2
+            wx_px = wx * TILE_SIZE - cam_x * TILE_SIZE + HALF_TILE
+            wy_px = wy * TILE_SIZE - cam_y * TILE_SIZE + HALF_TILE
             pygame.draw.line(screen, (80, 80, 255), (cx, cy), (int(wx_px), int(wy_px)), 2)
     
 def configure_from_world(map_width, map_height, tile_size, view_tiles_x, view_tiles_y):
@@ -694,14 +1016,17 @@ def configure_from_world(map_width, map_height, tile_size, view_tiles_x, view_ti
     Called once from blobs.py after reading config.yaml.
     Keeps entity logic (movement, sight radii, drawing) in sync with config.
     """
-    global MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, VIEW_TILES_X, VIEW_TILES_Y
+    global MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, HALF_TILE, VIEW_TILES_X, VIEW_TILES_Y
 
     MAP_WIDTH = map_width
     MAP_HEIGHT = map_height
     TILE_SIZE = tile_size
+    HALF_TILE = tile_size / 2
     VIEW_TILES_X = view_tiles_x
     VIEW_TILES_Y = view_tiles_y
 
     # Update Blob's class-level radii so all instances use the new tile size
     Blob.EAT_RADIUS = TILE_SIZE * 0.4
-    Blob.DRINK_RADIUS = TILE_SIZE * 0.4
\ No newline at end of file
+    Blob.DRINK_RADIUS = TILE_SIZE * 0.4
+    Blob.EAT_RADIUS_SQ = Blob.EAT_RADIUS * Blob.EAT_RADIUS
+    Blob.DRINK_RADIUS_SQ = Blob.DRINK_RADIUS * Blob.DRINK_RADIUS
\ No newline at end of file
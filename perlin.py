@@ -0,0 +1,104 @@
+import numpy as np
+
+# -------------------------------------------------------------------
+# VECTORIZED PERLIN NOISE
+# -------------------------------------------------------------------
+# A NumPy port of the 2D Perlin noise from the `noise` package
+# (noise.pnoise2 with base=0). It evaluates a whole grid of samples per
+# call and works in float32 like the C original, so a given seed still
+# produces the same world.
+
+# Ken Perlin's reference permutation, repeated so PERM[i + j] never wraps
+_P = [
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+]
+PERM = np.array(_P * 2, dtype=np.int32)
+
+# x / y components of the 16 gradient directions, indexed by hash & 15
+GRAD_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float32)
+GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float32)
+
+
+def _grad(h, x, y):
+    h = h & 15
+    return x * GRAD_X[h] + y * GRAD_Y[h]
+
+
+def _noise(x, y, repeatx, repeaty):
+    """Single octave of noise for broadcastable float32 arrays x and y."""
+    i = np.floor(np.fmod(x, repeatx)).astype(np.int32)
+    j = np.floor(np.fmod(y, repeaty)).astype(np.int32)
+    ii = np.fmod((i + 1).astype(np.float32), repeatx).astype(np.int32) & 255
+    jj = np.fmod((j + 1).astype(np.float32), repeaty).astype(np.int32) & 255
+    i &= 255
+    j &= 255
+
+    x = x - np.floor(x)
+    y = y - np.floor(y)
+    fx = x * x * x * (x * (x * 6 - 15) + 10)
+    fy = y * y * y * (y * (y * 6 - 15) + 10)
+
+    a = PERM[i]
+    b = PERM[ii]
+    aa = PERM[a + j]
+    ab = PERM[a + jj]
+    ba = PERM[b + j]
+    bb = PERM[b + jj]
+
+    one = np.float32(1)
+    g00 = _grad(PERM[aa], x, y)
+    g10 = _grad(PERM[ba], x - one, y)
+    g01 = _grad(PERM[ab], x, y - one)
+    g11 = _grad(PERM[bb], x - one, y - one)
+
+    lo = g00 + fx * (g10 - g00)
+    hi = g01 + fx * (g11 - g01)
+    return lo + fy * (hi - lo)
+
+
+def pnoise2_grid(xs, ys, octaves=1, persistence=0.5, lacunarity=2.0,
+                 repeatx=1024, repeaty=1024):
+    """
+    Fractal Perlin noise sampled at every (xs[c], ys[r]).
+
+    xs and ys are 1-D coordinate arrays; returns a (len(ys), len(xs))
+    float32 array in roughly [-1, 1], matching noise.pnoise2 per sample.
+    """
+    x = np.asarray(xs, dtype=np.float32)[None, :]
+    y = np.asarray(ys, dtype=np.float32)[:, None]
+    repeatx = np.float32(repeatx)
+    repeaty = np.float32(repeaty)
+
+    if octaves == 1:
+        # x (1, W) and y (H, 1) broadcast to a fresh, writable (H, W) array
+        return _noise(x, y, repeatx, repeaty)
+
+    persistence = np.float32(persistence)
+    lacunarity = np.float32(lacunarity)
+    freq = np.float32(1)
+    amp = np.float32(1)
+    max_amp = np.float32(0)
+    total = np.zeros((y.size, x.size), dtype=np.float32)
+
+    for _ in range(octaves):
+        total += _noise(x * freq, y * freq, repeatx * freq, repeaty * freq) * amp
+        max_amp += amp
+        freq *= lacunarity
+        amp *= persistence
+
+    return total / max_amp
@@ -1,6 +1,9 @@
+import bisect
 import random
+import numpy as np
 import pygame
-from noise import pnoise2
+
+import perlin
 
 # -------------------------------------------------------------------
 # TILE CONSTANTS (match the old monolithic version)
@@ -16,6 +19,10 @@ ICE           = 7
 
 ALL_TILES = [SHALLOW_WATER, WATER, DEEP_WATER, SAND, GRASS, FOREST]
 
+# WALKABLE_LUT[t] is True for tile types blobs can walk on
+WALKABLE_LUT = np.zeros(8, dtype=np.bool_)
+WALKABLE_LUT[[SAND, GRASS, FOREST]] = True
+
 # -------------------------------------------------------------------
 # NOISE SETTINGS (can be overridden by config passed from blobs.py)
 # -------------------------------------------------------------------
@@ -24,21 +31,28 @@ NOISE_OCTAVES     = 4
 NOISE_PERSISTENCE = 0.5
 NOISE_LACUNARITY  = 2.0
 NOISE_SEED        = random.randint(0, 9999)
+NOISE_TILE        = 32    # rows of noise generated per vectorized batch
 
 
 # -------------------------------------------------------------------
 # IMAGE HELPERS
 # -------------------------------------------------------------------
 def load_tile(path: str, tile_size: int) -> pygame.Surface:
-    """Load a tile image and scale it to tile_size x tile_size."""
+    """
+    Load an opaque terrain tile and scale it to tile_size x tile_size.
+
+    Terrain images cover the whole tile, so they are converted without
+    per-pixel alpha; blitting them is then a plain copy instead of a blend.
+    Use load_sprite for anything with transparency.
+    """
     try:
-        img = pygame.image.load(path).convert_alpha()
+        img = pygame.image.load(path).convert()
         img = pygame.transform.scale(img, (tile_size, tile_size))
         return img
     except pygame.error:
         print(f"Warning: Could not load tile {path}")
         # Create a fallback colored surface
-        surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        surf = pygame.Surface((tile_size, tile_size)).convert()
         if "grass" in path:
             surf.fill((0, 128, 0, 255))  # Green for grass
         else:
@@ -47,9 +61,15 @@ def load_tile(path: str, tile_size: int) -> pygame.Surface:
 
 
 def load_sprite(path: str, tile_size: int) -> pygame.Surface:
-    """Load a sprite image and scale it to tile_size x tile_size."""
+    """
+    Load a transparent sprite image and scale it to tile_size x tile_size.
+
+    The sprite is marked RLEACCEL so SDL run-length encodes it on first
+    blit and skips its fully transparent runs afterwards.
+    """
     img = pygame.image.load(path).convert_alpha()
     img = pygame.transform.scale(img, (tile_size, tile_size))
+    img.set_alpha(255, pygame.RLEACCEL)
     return img
 
 
@@ -73,59 +93,94 @@ def apply_noise_config(noise_cfg: dict):
         NOISE_SEED = seed
 
 
-def generate_height_map(width: int, height: int, noise_cfg: dict | None = None):
-    """Generate a 2D array of heights in [0, 1] using Perlin noise."""
+def generate_height_map(width: int, height: int, noise_cfg: dict | None = None) -> np.ndarray:
+    """Generate a (height, width) float32 array of heights in [0, 1] using Perlin noise."""
     apply_noise_config(noise_cfg)
 
-    height_map = [[0.0 for _ in range(width)] for _ in range(height)]
+    xs = np.arange(width) / NOISE_SCALE + NOISE_SEED
+    ys = np.arange(height) / NOISE_SCALE + NOISE_SEED
+    height_map = np.empty((height, width), dtype=np.float32)
+
+    # Whole rows of samples per call; bands of NOISE_TILE rows keep the
+    # float32 temporaries small on big maps.
+    for y0 in range(0, height, NOISE_TILE):
+        n = perlin.pnoise2_grid(
+            xs,
+            ys[y0:y0 + NOISE_TILE],
+            octaves=NOISE_OCTAVES,
+            persistence=NOISE_PERSISTENCE,
+            lacunarity=NOISE_LACUNARITY,
+            repeatx=1024,
+            repeaty=1024,
+        )
+
+        # normalise -1..1 to 0..1
+        height_map[y0:y0 + NOISE_TILE] = (n + 1) / 2.0
 
-    for y in range(height):
-        for x in range(width):
-            nx = x / NOISE_SCALE
-            ny = y / NOISE_SCALE
+    return height_map
 
-            n = pnoise2(
-                nx + NOISE_SEED,
-                ny + NOISE_SEED,
-                octaves=NOISE_OCTAVES,
-                persistence=NOISE_PERSISTENCE,
-                lacunarity=NOISE_LACUNARITY,
-                repeatx=1024,
-                repeaty=1024,
-                base=0,
-            )
 
-            # normalise -1..1 to 0..1
-            h = (n + 1) / 2.0
-            height_map[y][x] = h
+def standardise_map(height_map) -> np.ndarray:
+    """Normalise arbitrary height values to [0, 1] range (as a float32 array)."""
+    arr = np.array(height_map, dtype=np.float32)
+    min_v = arr.min()
+    max_v = arr.max()
+    rng = max_v - min_v if max_v != min_v else 1e-9
 
-    return height_map
+    np.subtract(arr, min_v, out=arr)
+    np.divide(arr, rng, out=arr)
+    return arr
 
 
-def standardise_map(height_map):
-    """Normalise arbitrary height values to [0, 1] range."""
-    flat = [v for row in height_map for v in row]
-    min_v = min(flat)
-    max_v = max(flat)
-    rng = max_v - min_v if max_v != min_v else 1e-9
+# upper height bounds of each band and the tile each band maps to
+HEIGHT_BINS = np.array([0.1, 0.28, 0.35, 0.42, 0.8])
+HEIGHT_TILES = np.array([DEEP_WATER, WATER, SHALLOW_WATER, SAND, GRASS, FOREST], dtype=np.int8)
 
-    return [[(v - min_v) / rng for v in row] for row in height_map]
+# plain-list copies for the scalar path (no NumPy scalar round trip)
+_HEIGHT_BINS_LIST = HEIGHT_BINS.tolist()
+_HEIGHT_TILES_LIST = HEIGHT_TILES.tolist()
+
+
+def height_to_tile_array(height_arr) -> np.ndarray:
+    """Map an array of height values (0..1) to an int8 array of tile types."""
+    return HEIGHT_TILES[np.digitize(height_arr, HEIGHT_BINS)]
 
 
 def height_to_tile(h: float) -> int:
     """Map height value (0..1) to tile type."""
-    if h < 0.1:
-        return DEEP_WATER
-    elif h < 0.28:
-        return WATER
-    elif h < 0.35:
-        return SHALLOW_WATER
-    elif h < 0.42:
-        return SAND
-    elif h < 0.8:
-        return GRASS
-    else:
-        return FOREST
+    return _HEIGHT_TILES_LIST[bisect.bisect_right(_HEIGHT_BINS_LIST, h)]
+
+
+def build_tile_map(height_map) -> np.ndarray:
+    """
+    Classify a height map into a (height, width) int8 tile map.
+
+    One contiguous byte per tile instead of a list of boxed ints per row;
+    index it as tile_map[y, x].
+    """
+    return height_to_tile_array(np.asarray(height_map))
+
+
+def shallow_water_adjacency(tile_map: np.ndarray) -> np.ndarray:
+    """
+    Return a (height, width) bool map that is True for tiles with a
+    SHALLOW_WATER tile directly above, below, left or right of them.
+    """
+    shallow = tile_map == SHALLOW_WATER
+    adj = np.zeros_like(shallow)
+    adj[1:, :] |= shallow[:-1, :]
+    adj[:-1, :] |= shallow[1:, :]
+    adj[:, 1:] |= shallow[:, :-1]
+    adj[:, :-1] |= shallow[:, 1:]
+    return adj
+
+
+def water_access_mask(tile_map: np.ndarray) -> np.ndarray:
+    """
+    Return a (height, width) bool map of walkable tiles (sand, grass,
+    forest) that blobs can drink from, i.e. ones next to SHALLOW_WATER.
+    """
+    return WALKABLE_LUT[tile_map] & shallow_water_adjacency(tile_map)
 
 
 # -------------------------------------------------------------------
@@ -133,11 +188,11 @@ def height_to_tile(h: float) -> int:
 # -------------------------------------------------------------------
 def create_grass_variant_map(tile_map, seed=None, weights=None):
     """
-    Create a 2D array with grass variant indices for each position.
-    This ensures each grass tile always shows the same variant.
+    Create a (height, width) int8 array of grass variant indices, -1 for
+    non-grass tiles. This ensures each grass tile always shows the same variant.
     
     Args:
-        tile_map: 2D array of tile types
+        tile_map: (height, width) array of tile types
         seed: Optional seed for deterministic generation
         weights: List of 4 probabilities for [grass_1, grass_2, grass_3, grass_4]
                  Default: [0.7, 0.1, 0.1, 0.1] - 70% grass_1, 10% each for others
@@ -150,45 +205,32 @@ def create_grass_variant_map(tile_map, seed=None, weights=None):
     if total > 0:
         weights = [w/total for w in weights]
     
-    if seed is not None:
-        # Save current random state
-        import random as random_module
-        original_state = random_module.getstate()
-        random_module.seed(seed)
-    
-    height = len(tile_map)
-    width = len(tile_map[0]) if height > 0 else 0
-    
-    grass_map = []
-    
-    for y in range(height):
-        row = []
-        for x in range(width):
-            if tile_map[y][x] == GRASS:
-                # Weighted random choice using provided weights
-                rand_val = random.random()
-                
-                # Calculate cumulative probabilities
-                cumul = 0
-                variant = 0  # Default to grass_1
-                for i, weight in enumerate(weights):
-                    cumul += weight
-                    if rand_val < cumul:
-                        variant = i
-                        break
-                
-                row.append(variant)
-            else:
-                row.append(None)  # Not a grass tile
-        grass_map.append(row)
-    
-    if seed is not None:
-        # Restore random state
-        random_module.setstate(original_state)
+    # one uniform draw per tile, mapped to a variant through the
+    # cumulative weights; a seed always gives the same variants
+    if seed is None:
+        seed = random.getrandbits(64)
+    else:
+        # default_rng only takes non-negative ints; hash() maps any int or
+        # float seed (as random.seed accepts) onto one, leaving small
+        # non-negative ints unchanged
+        seed = hash(seed) & (2**64 - 1)
+    rng = np.random.default_rng(seed)
+    cum = np.cumsum(weights)
+    u = rng.random(tile_map.shape)
+    variants = np.searchsorted(cum, u, side="right")
+    np.minimum(variants, len(weights) - 1, out=variants)
+
+    # -1 marks non-grass tiles
+    grass_map = np.where(tile_map == GRASS, variants, -1).astype(np.int8)
     
     return grass_map
 
 
+# get_random_grass samples variants from a table of 2**GRASS_LUT_BITS entries
+GRASS_LUT_BITS = 10
+GRASS_LUT_SIZE = 1 << GRASS_LUT_BITS
+
+
 # Update GrassTileManager class to store the map
 class GrassTileManager:
     """Manages multiple grass tile variants with weighted probabilities."""
@@ -198,6 +240,7 @@ class GrassTileManager:
         self.variants = []
         self.weights = [0.7, 0.1, 0.1, 0.1]  # NEW DEFAULT WEIGHTS
         self.grass_map = None
+        self._variant_lut = []
         
     def load_variants(self, base_path: str = "tiles/grass", count: int = 4, weights=None):
         """
@@ -226,6 +269,13 @@ class GrassTileManager:
         if total > 0:
             self.weights = [w/total for w in self.weights]
         
+        # inverse-CDF table: entry k is the variant picked by a uniform draw
+        # in [k, k+1) / GRASS_LUT_SIZE, so sampling is a single index
+        cum = np.cumsum(self.weights)
+        cells = (np.arange(GRASS_LUT_SIZE) + 0.5) / GRASS_LUT_SIZE
+        lut = np.searchsorted(cum, cells, side="right")
+        self._variant_lut = np.minimum(lut, count - 1).tolist()
+        
         for i in range(1, count + 1):
             path = f"{base_path}_{i}.png"
             try:
@@ -252,11 +302,12 @@ class GrassTileManager:
         if not self.variants:
             return self.get_fallback_grass()
         
-        if self.grass_map is None or y >= len(self.grass_map) or x >= len(self.grass_map[0]):
+        grass_map = self.grass_map
+        if grass_map is None or y >= grass_map.shape[0] or x >= grass_map.shape[1]:
             return self.get_random_grass()
         
-        variant = self.grass_map[y][x]
-        if variant is None or variant >= len(self.variants):
+        variant = grass_map.item(y, x)
+        if variant < 0 or variant >= len(self.variants):
             return self.get_random_grass()
         
         return self.variants[variant]
@@ -265,7 +316,7 @@ class GrassTileManager:
         """Fallback method if no map exists."""
         if not self.variants:
             return self.get_fallback_grass()
-        return random.choices(self.variants, weights=self.weights, k=1)[0]
+        return self.variants[self._variant_lut[random.getrandbits(GRASS_LUT_BITS)]]
     
     def get_fallback_grass(self) -> pygame.Surface:
         surf = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
@@ -273,6 +324,94 @@ class GrassTileManager:
         return surf
 
 
+# screen positions of every view tile, keyed by (tiles_x, tiles_y, tile_size)
+_TILE_DESTS = {}
+
+
+def _tile_dest_rows(view_tiles_x: int, view_tiles_y: int, tile_size: int):
+    """Return [sy][sx] -> (px, py) for the view grid (built once per size)."""
+    key = (view_tiles_x, view_tiles_y, tile_size)
+    dests = _TILE_DESTS.get(key)
+    if dests is None:
+        dests = [
+            [(sx * tile_size, sy * tile_size) for sx in range(view_tiles_x)]
+            for sy in range(view_tiles_y)
+        ]
+        _TILE_DESTS[key] = dests
+    return dests
+
+
+# the world is baked into CHUNK_TILES x CHUNK_TILES tile surfaces on first
+# sight; "chunks" maps (chunk_x, chunk_y) -> Surface in least-recently-used
+# order and is dropped when "key" (tile map, grass map, tile size) changes.
+# At most CHUNK_CACHE_SCREENS views' worth of chunks are kept.
+CHUNK_TILES = 32
+CHUNK_CACHE_SCREENS = 4
+_TILE_CHUNKS = {"key": None, "chunks": {}}
+
+
+# trees inside the view window; rebuilt when "key" (window, tree list) changes
+_VISIBLE_TREES = {"key": None, "trees": []}
+
+
+def invalidate_tile_layer():
+    """Force the tile chunks to be re-baked (call after editing tile_map)."""
+    _TILE_CHUNKS["key"] = None
+    _TILE_CHUNKS["chunks"] = {}
+
+
+def _render_tile_layer(
+    tile_map, grass_tile_manager,
+    cam_x, cam_y, view_tiles_x, view_tiles_y, tile_size, tile_images,
+) -> pygame.Surface:
+    """
+    Return a new surface with the view_tiles_x x view_tiles_y tiles
+    starting at (cam_x, cam_y) drawn on it (black outside the map).
+    """
+    surf = pygame.Surface((view_tiles_x * tile_size, view_tiles_y * tile_size)).convert()
+    surf.fill((0, 0, 0))
+
+    map_h, map_w = tile_map.shape
+    dests = _tile_dest_rows(view_tiles_x, view_tiles_y, tile_size)
+
+    # clamp the view to the map once instead of bounds-checking every tile
+    wy0, wy1 = max(cam_y, 0), min(cam_y + view_tiles_y, map_h)
+    wx0, wx1 = max(cam_x, 0), min(cam_x + view_tiles_x, map_w)
+    if wy0 >= wy1 or wx0 >= wx1:
+        return surf
+
+    variants = grass_tile_manager.variants
+    grass_map = grass_tile_manager.grass_map
+    if variants and grass_map is not None and grass_map.shape == tile_map.shape:
+        grass_rows = grass_map[wy0:wy1, wx0:wx1].tolist()
+    else:
+        grass_rows = None
+    get_grass = grass_tile_manager.get_grass_for_tile
+
+    # one (image, dest) pair per visible tile, filled in place and handed
+    # to a single surf.blits call
+    draws = [None] * ((wy1 - wy0) * (wx1 - wx0))
+    k = 0
+    for row, wy in zip(tile_map[wy0:wy1, wx0:wx1].tolist(), range(wy0, wy1)):
+        dest_row = dests[wy - cam_y][wx0 - cam_x:wx1 - cam_x]
+        grass_row = grass_rows[wy - wy0] if grass_rows is not None else None
+        for i, tile_type in enumerate(row):
+            # Special handling for grass tiles
+            if tile_type == GRASS:
+                if grass_row is not None:
+                    img = variants[grass_row[i]]
+                else:
+                    img = get_grass(wx0 + i, wy)
+            else:
+                img = tile_images[tile_type]
+
+            draws[k] = (img, dest_row[i])
+            k += 1
+
+    surf.blits(draws, doreturn=False)
+    return surf
+
+
 # Update draw_world function
 def draw_world(
     screen: pygame.Surface,
@@ -294,47 +433,74 @@ def draw_world(
     blobs,
 ):
     """Draw tiles + all entities in the correct order."""
-    # --- tiles ---
-    map_h = len(tile_map)
-    map_w = len(tile_map[0]) if map_h > 0 else 0
-    
-    for sy in range(view_tiles_y):
-        wy = cam_y + sy
-        if 0 <= wy < map_h:
-            for sx in range(view_tiles_x):
-                wx = cam_x + sx
-                if 0 <= wx < map_w:
-                    tile_type = tile_map[wy][wx]
-                    
-                    # Special handling for grass tiles
-                    if tile_type == GRASS:
-                        img = grass_tile_manager.get_grass_for_tile(wx, wy)
-                    else:
-                        img = tile_images[tile_type]
-                        
-                    screen.blit(img, (sx * tile_size, sy * tile_size))
-
-    # --- decorations ---
-    for flower in flowers:
-        flower.draw(screen, cam_x, cam_y)
-
-    for mushroom in mushrooms:
-        mushroom.draw(screen, cam_x, cam_y)
-
-    for cane in sugarcanes:
-        cane.draw(screen, cam_x, cam_y)
-
-    for rock in rocks:
-        rock.draw(screen, cam_x, cam_y)
-
-    # --- bushes ---
-    for bush in bushes:
-        bush.draw(screen, berry_bush_images, cam_x, cam_y)
+    # --- tiles (blitted from the baked chunks under the view) ---
+    grass_map = grass_tile_manager.grass_map
+    key = (id(tile_map), id(grass_map), tile_size)
+    if _TILE_CHUNKS["key"] != key:
+        _TILE_CHUNKS["key"] = key
+        _TILE_CHUNKS["chunks"] = {}
+    chunks = _TILE_CHUNKS["chunks"]
+
+    map_h, map_w = tile_map.shape
+    chunk_px = CHUNK_TILES * tile_size
+    off_x = cam_x * tile_size
+    off_y = cam_y * tile_size
+    cx0, cx1 = max(cam_x, 0) // CHUNK_TILES, min(cam_x + view_tiles_x, map_w) - 1
+    cy0, cy1 = max(cam_y, 0) // CHUNK_TILES, min(cam_y + view_tiles_y, map_h) - 1
+    view_chunks = (view_tiles_x // CHUNK_TILES + 2) * (view_tiles_y // CHUNK_TILES + 2)
+
+    # chunks overhang the view, so keep them off the scrollbars and panel
+    old_clip = screen.get_clip()
+    screen.set_clip((0, 0, view_tiles_x * tile_size, view_tiles_y * tile_size))
+    for cy in range(cy0, cy1 // CHUNK_TILES + 1):
+        for cx in range(cx0, cx1 // CHUNK_TILES + 1):
+            # re-inserted on every use, so the dict stays in LRU order
+            chunk = chunks.pop((cx, cy), None)
+            if chunk is None:
+                chunk = _render_tile_layer(
+                    tile_map, grass_tile_manager,
+                    cx * CHUNK_TILES, cy * CHUNK_TILES, CHUNK_TILES, CHUNK_TILES,
+                    tile_size, tile_images,
+                )
+            chunks[(cx, cy)] = chunk
+            screen.blit(chunk, (cx * chunk_px - off_x, cy * chunk_px - off_y))
+    screen.set_clip(old_clip)
+
+    # drop the least recently seen chunks once past the cap
+    while len(chunks) > CHUNK_CACHE_SCREENS * view_chunks:
+        del chunks[next(iter(chunks))]
+
+    # --- decorations (entities.DecorationLayer) ---
+    flowers.draw(screen, cam_x, cam_y)
+    mushrooms.draw(screen, cam_x, cam_y)
+    sugarcanes.draw(screen, cam_x, cam_y)
+    rocks.draw(screen, cam_x, cam_y)
+
+    # --- bushes (entities.BerryBushes) ---
+    bushes.draw(screen, berry_bush_images, cam_x, cam_y)
+
+    # view window in tiles, one tile of margin for partly visible sprites
+    x0, x1 = cam_x - 1, cam_x + view_tiles_x + 1
+    y0, y1 = cam_y - 1, cam_y + view_tiles_y + 1
 
     # --- blobs on top of ground objects ---
-    for blob in blobs:
-        blob.draw(screen, cam_x, cam_y)
+    if blobs:
+        pool = blobs[0].pool
+        n = pool.size
+        near = (pool.x[:n] >= x0) & (pool.x[:n] < x1) & (pool.y[:n] >= y0) & (pool.y[:n] < y1)
+        for blob in blobs:
+            if near[blob.index]:
+                blob.draw(screen, cam_x, cam_y)
 
     # --- trees (on top of everything else) ---
-    for tree in trees:
+    # trees never move, so the visible ones are only re-collected when the
+    # camera does
+    key = (x0, y0, x1, y1, id(trees), len(trees))
+    if _VISIBLE_TREES["key"] != key:
+        _VISIBLE_TREES["trees"] = [
+            tree for tree in trees if x0 <= tree.x < x1 and y0 <= tree.y < y1
+        ]
+        _VISIBLE_TREES["key"] = key
+
+    for tree in _VISIBLE_TREES["trees"]:
         tree.draw(screen, cam_x, cam_y)
\ No newline at end of file
@@ -1,3 +1,6 @@
+from collections.abc import Sized
+
+import numpy as np
 import pygame
 
 
@@ -7,12 +10,12 @@ def build_static_stats(
     tile_size: int,
     total_tiles: int,
     tile_counts: dict,
-    bushes: list,
+    bushes: Sized,
     trees: list,
-    mushrooms: list,
-    sugarcanes: list,
-    rocks: list,
-    flowers: list,
+    mushrooms: Sized,
+    sugarcanes: Sized,
+    rocks: Sized,
+    flowers: Sized,
     flower_type_counts: list,
     noise_seed: int,
 ) -> list[str]:
@@ -20,6 +23,9 @@ def build_static_stats(
     Build the static stats text lines for the side panel.
     These do NOT change during the simulation (except blobs count,
     which is updated separately in draw_side_panel).
+
+    Only len() is taken of the entity collections, so `bushes` can be a
+    BerryBushes and the decorations DecorationLayers.
     """
     stats_lines = [
         "World info:",
@@ -56,64 +62,123 @@ def build_static_stats(
     return stats_lines
 
 
-def draw_side_panel(
-    screen: pygame.Surface,
+# rendered text surfaces keyed by (font, text, color); most panel lines
+# repeat across frames, so they only go through FreeType once
+LABEL_CACHE_SIZE = 256
+_label_cache = {}
+
+
+def _render_cached(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    key = (font, text, tuple(color))
+    surf = _label_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        if len(_label_cache) >= LABEL_CACHE_SIZE:
+            _label_cache.clear()
+        _label_cache[key] = surf
+    return surf
+
+
+def _is_blobs_line(line: str) -> bool:
+    return line.strip().startswith("Blobs:")
+
+
+def render_static_panel(
     font: pygame.font.Font,
-    panel_x: int,
     panel_width: int,
     window_height: int,
     stats_lines: list[str],
-    blobs: list,
     ui_cfg: dict,
-):
+) -> tuple[pygame.Surface, dict]:
     """
-    Draw the entire right side panel: static stats, oldest blob info,
-    and age distribution bars.
+    Render the panel background and the static stats lines once.
+
+    Returns the panel surface and a layout dict with the y offsets of the
+    dynamic parts (blobs count, oldest blob info, age bars) and their
+    pre-rendered headers. The blobs count line is left empty;
+    draw_side_panel fills it in every frame on top of this surface.
     """
-    # Colors from config (with defaults)
     colors = ui_cfg.get("colors", {})
     panel_bg = colors.get("panel_bg", (30, 30, 40))
     text_color = colors.get("text", (255, 255, 255))
     header_color = colors.get("header", (255, 230, 120))
 
-    # panel background
-    pygame.draw.rect(
-        screen,
-        panel_bg,
-        (panel_x, 0, panel_width, window_height),
-    )
+    surf = pygame.Surface((panel_width, window_height)).convert()
+    surf.fill(panel_bg)
 
+    blobs_y = None
     y_offset = 10
-
-    # --- Static world stats ---
     for line in stats_lines:
-        render_text = line
-        # dynamically replace blobs count
-        if line.strip().startswith("Blobs:"):
-            render_text = f"  Blobs:        {len(blobs)}"
+        if _is_blobs_line(line):
+            blobs_y = y_offset
+        else:
+            color = text_color
+            if line.endswith(":") or "info" in line:
+                color = header_color
+
+            text_surf = font.render(line, True, color)
+            surf.blit(text_surf, (10, y_offset))
+        y_offset += 20
 
-        color = text_color
-        if render_text.endswith(":") or "info" in render_text:
-            color = header_color
+    # below the stats: gap, "Oldest blob:" header, 8 lines of 18px, gap,
+    # "Age distribution:" title, then the bars
+    oldest_y = y_offset + 10
+    age_title_y = oldest_y + 20 + 8 * 18 + 10
+    layout = {
+        "blobs_y": blobs_y,
+        "oldest_header": font.render("Oldest blob:", True, header_color),
+        "oldest_header_y": oldest_y,
+        "oldest_lines_y": oldest_y + 20,
+        "age_title": font.render("Age distribution:", True, header_color),
+        "age_title_y": age_title_y,
+        "age_bars_y": age_title_y + 22,
+    }
+    return surf, layout
 
-        text_surf = font.render(render_text, True, color)
-        screen.blit(text_surf, (panel_x + 10, y_offset))
-        y_offset += 20
+
+def draw_side_panel(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    panel_x: int,
+    panel_width: int,
+    static_panel: pygame.Surface,
+    layout: dict,
+    blobs: list,
+    ui_cfg: dict,
+):
+    """
+    Draw the entire right side panel: static stats (pre-rendered by
+    render_static_panel), oldest blob info and age distribution bars.
+    Only the lines that change are rendered here, at the offsets stored
+    in `layout`.
+    """
+    # Colors from config (with defaults)
+    colors = ui_cfg.get("colors", {})
+    text_color = colors.get("text", (255, 255, 255))
+
+    # panel background + static world stats
+    screen.blit(static_panel, (panel_x, 0))
+
+    # --- dynamic blobs count ---
+    if layout["blobs_y"] is not None:
+        text_surf = _render_cached(font, f"  Blobs:        {len(blobs)}", text_color)
+        screen.blit(text_surf, (panel_x + 10, layout["blobs_y"]))
 
     # --- Oldest blob detailed info ---
     if blobs:
-        oldest = max(blobs, key=lambda b: b.age)
-
-        y_offset += 10  # small gap
+        # one gather of every blob's age from the shared BlobPool column
+        # serves both the oldest blob and the age buckets
+        rows = np.fromiter((b.index for b in blobs), dtype=np.intp, count=len(blobs))
+        ages = blobs[0].pool.age[rows]
+        oldest = blobs[int(ages.argmax())]
 
         # header
-        header = font.render("Oldest blob:", True, header_color)
-        screen.blit(header, (panel_x + 10, y_offset))
-        y_offset += 20
+        screen.blit(layout["oldest_header"], (panel_x + 10, layout["oldest_header_y"]))
+        y_offset = layout["oldest_lines_y"]
 
         def bl(text: str):
             nonlocal y_offset
-            surf = font.render(text, True, text_color)
+            surf = _render_cached(font, text, text_color)
             screen.blit(surf, (panel_x + 20, y_offset))
             y_offset += 18
 
@@ -127,16 +192,12 @@ def draw_side_panel(
         bl(f"Intelligence:{oldest.intelligence}")
 
         # --- Age distribution graphs ---
-        y_offset += 10  # small gap below stats
-
-        title = font.render("Age distribution:", True, header_color)
-        screen.blit(title, (panel_x + 10, y_offset))
-        y_offset += 22
-
+        screen.blit(layout["age_title"], (panel_x + 10, layout["age_title_y"]))
+        y_offset = layout["age_bars_y"]
         # Count blobs in each age bucket
-        young_count = sum(1 for b in blobs if b.age <= 20)
-        adult_count = sum(1 for b in blobs if 20 < b.age < 200)
-        elder_count = sum(1 for b in blobs if b.age >= 200)
+        young_count = int(np.count_nonzero(ages <= 20))
+        elder_count = int(np.count_nonzero(ages >= 200))
+        adult_count = len(blobs) - young_count - elder_count
 
         max_count = max(1, young_count, adult_count, elder_count)
         bar_max_width = panel_width - 40  # padding inside panel
@@ -144,7 +205,7 @@ def draw_side_panel(
         def draw_age_bar(label: str, count: int, color_tuple):
             nonlocal y_offset
             # label with count
-            label_surf = font.render(f"{label}: {count}", True, text_color)
+            label_surf = _render_cached(font, f"{label}: {count}", text_color)
             screen.blit(label_surf, (panel_x + 20, y_offset))
             y_offset += 18
 
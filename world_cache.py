@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import zipfile
+
+import numpy as np
+
+
+# -------------------------------------------------------------------
+# WORLD CACHE
+# -------------------------------------------------------------------
+# A generated world (tile map, grass variants and the spawn positions of
+# every entity) is stored as a single .npz file named by the noise seed and
+# a hash of every setting that shapes the world, so changing the config
+# generates a fresh world instead of loading a stale one. Loading it skips
+# height map generation and the spawn loops entirely.
+
+OBJECT_KEYS = ("trees", "blobs")  # lists of objects with .x / .y
+# BerryBushes / DecorationLayers, saved from their own position columns
+COLUMN_KEYS = ("bushes", "flowers", "mushrooms", "sugarcanes", "rocks")
+
+
+def settings_key(**settings) -> str:
+    """Return a short blake2b hex key for JSON-serialisable `settings`."""
+    data = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def world_path(cache_dir: str, seed: int, key: str) -> str:
+    """Return the cache file path for a world generated from `seed` with settings `key`."""
+    return os.path.join(cache_dir, f"world_{seed}_{key}.npz")
+
+
+def _write_atomic(path: str, write):
+    """
+    Call write(file) on a temporary file next to `path`, then move it into
+    place, so an interrupted run never leaves a truncated cache file behind.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _positions(objects) -> np.ndarray:
+    """Pack object tile positions into an (N, 2) int16 array."""
+    return np.array([(o.x, o.y) for o in objects], dtype=np.int16).reshape(-1, 2)
+
+
+def save_world(path: str, tile_map, grass_map, **entities):
+    """
+    Save the generated world to `path`.
+
+    `entities` maps each name in OBJECT_KEYS to its list of spawned objects
+    and each name in COLUMN_KEYS to its BerryBushes / DecorationLayer; only
+    tile positions (and decoration kinds) are stored.
+    """
+    arrays = {key: _positions(entities[key]) for key in OBJECT_KEYS}
+    for key in COLUMN_KEYS:
+        arrays[key] = entities[key].positions().astype(np.int16)
+
+    _write_atomic(path, lambda f: np.savez(
+        f,
+        tile_map=np.asarray(tile_map, dtype=np.int8),
+        grass_map=np.asarray(grass_map, dtype=np.int8),
+        **arrays,
+    ))
+
+
+def load_world(path: str, map_width: int, map_height: int) -> dict | None:
+    """
+    Load a world saved by save_world.
+
+    Returns None if the file does not exist, cannot be read or was
+    generated for a different map size; the caller then regenerates the
+    world and overwrites it. The tile and grass maps come back as int8
+    arrays and positions as lists of int tuples.
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path) as data:
+            if data["tile_map"].shape != (map_height, map_width):
+                return None
+
+            world = {
+                "tile_map": data["tile_map"].astype(np.int8),
+                "grass_map": data["grass_map"].astype(np.int8),
+            }
+            for key in OBJECT_KEYS + COLUMN_KEYS:
+                world[key] = [tuple(p) for p in data[key].tolist()]
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+
+    return world
+
+
+# -------------------------------------------------------------------
+# TERRAIN CACHE
+# -------------------------------------------------------------------
+# The standardised height map depends only on the map size and the noise
+# settings, so for a fixed seed it is cached on its own as a .npy file
+# named by a hash of those settings. A world whose spawning config or grass
+# weights changed then skips the noise even though its world file misses.
+
+def terrain_path(cache_dir: str, width: int, height: int, scale: float,
+                 octaves: int, persistence: float, lacunarity: float,
+                 seed: float) -> str:
+    """Return the height map cache path for this map size and noise config."""
+    key = settings_key(
+        map_size=[width, height],
+        noise=[scale, octaves, persistence, lacunarity, seed],
+    )
+    return os.path.join(cache_dir, "terrain", f"heights_{key}.npy")
+
+
+def save_height_map(path: str, height_map):
+    """Save a standardised height map to `path`."""
+    _write_atomic(path, lambda f: np.save(f, np.asarray(height_map)))
+
+
+def load_height_map(path: str, map_width: int, map_height: int) -> np.ndarray | None:
+    """
+    Load a height map saved by save_height_map.
+
+    The file is memory-mapped read-only. Returns None if it does not exist,
+    cannot be read or has the wrong shape.
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        height_map = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if height_map.shape != (map_height, map_width):
+        return None
+    return height_map